@@ -2,10 +2,74 @@ import streamlit as st
 import pandas as pd
 from smolagents import tool, CodeAgent,load_dotenv,ToolCallingAgent
 from smolagents import OpenAIServerModel  # or any other LLM backend you want
+from smolagents.memory import ActionStep
 
+import io
 import os
+from pathlib import Path
 
-load_dotenv()
+@st.cache_resource
+def load_env() -> dict:
+    """Read .env once per process; reruns reuse the resolved environment."""
+    load_dotenv()
+    return dict(os.environ)
+
+
+# ======================================
+# Data Loading
+# ======================================
+
+def read_csv(source) -> pd.DataFrame:
+    """Parse a CSV with the multithreaded PyArrow reader into Arrow-backed columns."""
+    return pd.read_csv(source, engine="pyarrow", dtype_backend="pyarrow")
+
+def categorize_securities(trade_activity: pd.DataFrame, positions: pd.DataFrame):
+    """Convert "Security" in both frames to a categorical sharing one category set.
+
+    Equality filters and group-bys then compare integer codes instead of Python strings.
+    """
+    categories = pd.Index(sorted(set(trade_activity["Security"]) | set(positions["Security"])))
+    for df in (trade_activity, positions):
+        df["Security"] = pd.Categorical(df["Security"], categories=categories)
+    return trade_activity, positions
+
+DATA_DIR = Path("data")
+TRADE_ACTIVITY_CSV = DATA_DIR / "trade_activity.csv"
+POSITIONS_CSV = DATA_DIR / "positions.csv"
+TOTAL_EQUITY_CSV = DATA_DIR / "total_equity.csv"
+
+# Key cached loads on path + mtime so an edited CSV invalidates the (disk-persisted) cache.
+# hash_funcs is matched on the concrete type (PosixPath/WindowsPath), hence type(DATA_DIR).
+PATH_HASH_FUNCS = {type(DATA_DIR): lambda p: (str(p), p.stat().st_mtime)}
+
+def index_by_security(trade_activity: pd.DataFrame, positions: pd.DataFrame):
+    """Index positions and group trades by security so tool calls are hash lookups, not column scans."""
+    # Keep the first position per security, matching the previous pos.iloc[0] behaviour
+    pos_by_sec = positions.drop_duplicates("Security").set_index("Security", drop=False)
+    trades_by_sec = {sec: trades for sec, trades in trade_activity.groupby("Security", sort=False, observed=True)}
+    # Both frames share the union of securities as their category set
+    all_securities = positions["Security"].cat.categories.tolist()
+    # Last trade price and trade count per security, shared by the per-security tools and reconcile_all
+    last_trades = trade_activity.groupby("Security", sort=False, observed=True)["Price"].agg(
+        **{"Last Trade Price": "last", "Trade Count": "size"}
+    )
+    return pos_by_sec, trades_by_sec, all_securities, last_trades
+
+# The loaders build the per-security index alongside the frames, so it is cached
+# under the same key (file mtimes or upload contents) and can never outlive them.
+
+@st.cache_data(persist="disk", show_spinner=False, hash_funcs=PATH_HASH_FUNCS)
+def load_frames(trade_path: Path, pos_path: Path, eq_path: Path):
+    """Load the three reconciliation datasets and their index once; reruns and process restarts reuse the cached result."""
+    trade_activity, positions = categorize_securities(read_csv(trade_path), read_csv(pos_path))
+    return trade_activity, positions, read_csv(eq_path), index_by_security(trade_activity, positions)
+
+@st.cache_data(show_spinner=False)
+def load_uploaded_frames(trade_bytes: bytes, pos_bytes: bytes, eq_bytes: bytes):
+    """Parse uploaded CSVs and index them, cached on the file contents so reruns skip the parse."""
+    trade_activity, positions, total_equity = (read_csv(io.BytesIO(raw)) for raw in (trade_bytes, pos_bytes, eq_bytes))
+    trade_activity, positions = categorize_securities(trade_activity, positions)
+    return trade_activity, positions, total_equity, index_by_security(trade_activity, positions)
 
 
 # ======================================
@@ -20,19 +84,31 @@ load_dotenv()
 # eq_file = st.file_uploader("Upload Total Equity CSV", type="csv")
 
 # if trade_file and pos_file and eq_file:
-trade_activity = pd.read_csv('data/trade_activity.csv')
-positions = pd.read_csv('data/positions.csv')
-total_equity = pd.read_csv('data/total_equity.csv')
+#     trade_activity, positions, total_equity, security_index = load_uploaded_frames(
+#         trade_file.getvalue(), pos_file.getvalue(), eq_file.getvalue()
+#     )
+trade_activity, positions, total_equity, security_index = load_frames(TRADE_ACTIVITY_CSV, POSITIONS_CSV, TOTAL_EQUITY_CSV)
+pos_by_sec, trades_by_sec, all_securities, last_trades = security_index
+last_price_by_sec = last_trades["Last Trade Price"].to_dict()
+trade_count_by_sec = last_trades["Trade Count"].to_dict()
+# total_equity is a single-row constants table; read it once into a plain dict
+equity_row = total_equity.iloc[0].to_dict()
 
 st.success("✅ Data loaded successfully!")
 
-# Show previews
-with st.expander("Preview Trade Activity"):
-    st.dataframe(trade_activity)
-with st.expander("Preview Positions"):
-    st.dataframe(positions)
-with st.expander("Preview Total Equity"):
-    st.dataframe(total_equity)
+PREVIEW_ROWS = 100
+
+@st.fragment
+def show_previews():
+    """Render bounded previews; interactions inside the fragment rerun only the previews."""
+    with st.expander("Preview Trade Activity"):
+        st.dataframe(trade_activity.head(PREVIEW_ROWS), use_container_width=True)
+    with st.expander("Preview Positions"):
+        st.dataframe(positions.head(PREVIEW_ROWS), use_container_width=True)
+    with st.expander("Preview Total Equity"):
+        st.dataframe(total_equity.head(PREVIEW_ROWS), use_container_width=True)
+
+show_previews()
 
 # ======================================
 # Define Tools (using uploaded data)
@@ -46,9 +122,7 @@ def list_securities() -> list:
     Returns:
         list: A list of unique security names from both Trade Activity and Positions datasets.
     """
-    ta_sec = set(trade_activity["Security"].unique())
-    pos_sec = set(positions["Security"].unique())
-    return list(ta_sec.union(pos_sec))
+    return list(all_securities)
 
 @tool
 def security_valuation(security: str) -> dict:
@@ -61,36 +135,33 @@ def security_valuation(security: str) -> dict:
     Returns:
         dict: Detailed analysis of position and price data
     """
-    pos = positions[positions["Security"] == security]
-    trades = trade_activity[trade_activity["Security"] == security]
-    
-    if pos.empty:
+    if security not in pos_by_sec.index:
         return {"error": f"No position found for {security}"}
 
-    row = pos.iloc[0]
-    calc_value = row["Current Position"] * row["Market Price"]
+    # Scalar .at/.iat reads avoid materializing a row Series per call
+    position = pos_by_sec.at[security, "Current Position"]
+    market_price = pos_by_sec.at[security, "Market Price"]
+    market_value = pos_by_sec.at[security, "Market Value"]
+    calc_value = position * market_price
     
-    # Calculate average trade price
-    if not trades.empty:
-        last_trade = trades.iloc[-1]
-        price_diff = row["Market Price"] - last_trade["Price"]
-    else:
-        price_diff = 0
+    # Compare against the last trade price
+    last_price = last_price_by_sec.get(security)
+    price_diff = market_price - last_price if last_price is not None else 0
 
     return {
         "Security": security,
-        "Current Position": row["Current Position"],
-        "Market Price": row["Market Price"],
-        "Last Trade Price": last_trade["Price"] if not trades.empty else None,
+        "Current Position": position,
+        "Market Price": market_price,
+        "Last Trade Price": last_price,
         "Price Difference": price_diff,
-        "Market Value (System)": row["Market Value"],
+        "Market Value (System)": market_value,
         "Market Value (Recalc)": calc_value,
-        "Valuation Diff": calc_value - row["Market Value"],
-        "Trade Count": len(trades)
+        "Valuation Diff": calc_value - market_value,
+        "Trade Count": trade_count_by_sec.get(security, 0)
     }
 
 @tool
-def security_trades(security: str) -> str:
+def security_trades(security: str) -> list:
     """
     Return all trades for a given security from the Trade Activity dataset.
     
@@ -98,12 +169,11 @@ def security_trades(security: str) -> str:
         security (str): The name or identifier of the security to get trades for.
         
     Returns:
-        str: String representation of all trades for the security, or error message if none found.
+        list: One dict per trade (Trade Activity columns, without the repeated Security column),
+            or an empty list if no trades were found.
     """
-    trades = trade_activity[trade_activity["Security"] == security]
-    if trades.empty:
-        return f"No trades found for {security}"
-    return trades.to_string(index=False)
+    trades = trades_by_sec.get(security, trade_activity.iloc[0:0])
+    return trades.drop(columns="Security").to_dict(orient="records")
 
 @tool
 def equity_breakdown() -> dict:
@@ -119,10 +189,10 @@ def equity_breakdown() -> dict:
             - 'Reported Closing Equity' (float): Reported closing equity from system
             - 'Break' (float): Difference between calculated and reported equity
     """
-    opening = total_equity.loc[0, "Opening Equity"]
-    trade_pl = total_equity.loc[0, "Trade P&L"]
-    market_pl = total_equity.loc[0, "Market Revaluation P&L"]
-    reported = total_equity.loc[0, "Closing Equity (Reported)"]
+    opening = equity_row["Opening Equity"]
+    trade_pl = equity_row["Trade P&L"]
+    market_pl = equity_row["Market Revaluation P&L"]
+    reported = equity_row["Closing Equity (Reported)"]
 
     calc_equity = opening + trade_pl + market_pl
 
@@ -146,30 +216,56 @@ def analyze_price_impact(security: str) -> dict:
     Returns:
         dict: Price impact analysis
     """
-    pos = positions[positions["Security"] == security]
-    trades = trade_activity[trade_activity["Security"] == security]
-    
-    if pos.empty:
+    if security not in pos_by_sec.index:
         return {"error": f"No position found for {security}"}
 
-    row = pos.iloc[0]
-    if not trades.empty:
-        last_trade = trades.iloc[-1]
-        theoretical_value = row["Current Position"] * last_trade["Price"]
-        reported_value = row["Market Value"]
+    last_price = last_price_by_sec.get(security)
+    if last_price is not None:
+        position = pos_by_sec.at[security, "Current Position"]
+        theoretical_value = position * last_price
+        reported_value = pos_by_sec.at[security, "Market Value"]
         price_impact = reported_value - theoretical_value
         
         return {
             "Security": security,
-            "System Price": row["Market Price"],
-            "Last Trade Price": last_trade["Price"],
-            "Position": row["Current Position"],
+            "System Price": pos_by_sec.at[security, "Market Price"],
+            "Last Trade Price": last_price,
+            "Position": position,
             "Theoretical Value": theoretical_value,
             "Reported Value": reported_value,
             "Price Impact": price_impact
         }
     return {"error": "No trades found"}
 
+@tool
+def reconcile_all() -> list:
+    """
+    Return the full per-security reconciliation table in a single call.
+    
+    Returns:
+        list: One dict per security in Positions with:
+            - 'Security', 'Current Position', 'Market Price'
+            - 'Last Trade Price' (float or None) and 'Trade Count' (int)
+            - 'Price Difference': Market Price minus Last Trade Price (0 if no trades)
+            - 'Market Value (System)', 'Market Value (Recalc)', 'Valuation Diff'
+            - 'Theoretical Value': position valued at the last trade price
+            - 'Price Impact': system market value minus theoretical value
+    """
+    recon = (
+        pos_by_sec.reset_index(drop=True)[["Security", "Current Position", "Market Price", "Market Value"]]
+        .merge(last_trades.reset_index(), on="Security", how="left")
+        .rename(columns={"Market Value": "Market Value (System)"})
+    )
+    recon["Trade Count"] = recon["Trade Count"].fillna(0).astype(int)
+    recon["Price Difference"] = (recon["Market Price"] - recon["Last Trade Price"]).fillna(0)
+    recon["Market Value (Recalc)"] = recon["Current Position"] * recon["Market Price"]
+    recon["Valuation Diff"] = recon["Market Value (Recalc)"] - recon["Market Value (System)"]
+    recon["Theoretical Value"] = recon["Current Position"] * recon["Last Trade Price"]
+    recon["Price Impact"] = recon["Market Value (System)"] - recon["Theoretical Value"]
+    # NaN (securities without trades) is not JSON serializable; surface it as None
+    recon = recon.astype(object).where(recon.notna(), None)
+    return recon.to_dict(orient="records")
+
 # ======================================
 # Agent Setup
 # ======================================
@@ -180,11 +276,12 @@ prompt_templates = {
 
     Analysis Steps:
     1. First, check the overall equity break using equity_breakdown()
-    2. Get all securities using list_securities()
-    3. For each security:
+    2. Get the per-security reconciliation table for every security in one call using reconcile_all()
+    3. Only for securities that show a Valuation Diff, Price Difference or Price Impact:
        - Check security_valuation() for position and price discrepancies
        - Use analyze_price_impact() to quantify price-related issues
        - Review security_trades() for any trade-related impacts
+    Use list_securities() only if you need the full list of names, including securities with trades but no position.
     
     Focus Areas:
     - Price differences between trade price and system price
@@ -206,31 +303,58 @@ prompt_templates = {
     "final_answer": {"pre_messages": "", "post_messages": ""},
     }
 
-model = OpenAIServerModel(
-    model_id="deepseek/deepseek-chat-v3.1",
-    api_base="https://openrouter.ai/api/v1",
-    api_key=os.getenv("OPENROUTER_API_KEY"),
-)
-tools = [list_securities, security_valuation, security_trades, equity_breakdown,analyze_price_impact]
-agent = ToolCallingAgent(tools=tools, model=model,prompt_templates=prompt_templates, add_base_tools=True)
+@st.cache_resource
+def get_agent():
+    """Build the model and agent once per process instead of on every rerun.
+
+    The tools read the module-level frames, which come from the cached loaders
+    above, so the agent keeps stable references across reruns.
+    """
+    model = OpenAIServerModel(
+        model_id="deepseek/deepseek-chat-v3.1",
+        api_base="https://openrouter.ai/api/v1",
+        api_key=load_env().get("OPENROUTER_API_KEY"),
+    )
+    tools = [reconcile_all, list_securities, security_valuation, security_trades, equity_breakdown,analyze_price_impact]
+    return ToolCallingAgent(tools=tools, model=model,prompt_templates=prompt_templates)
+
+def run_streaming(agent, query: str, status):
+    """Run the agent step by step, logging each tool call to `status` as it completes.
+
+    The last item yielded by a streamed run is the final answer, which is returned.
+    """
+    step = None
+    for step in agent.run(query, stream=True):
+        if isinstance(step, ActionStep):
+            for call in step.tool_calls or []:
+                status.write(f"Step {step.step_number}: `{call.name}({call.arguments or ''})`")
+    return step
 
 # ======================================
 # User Query
 # ======================================   
 
 query = st.chat_input("Ask me anything about stocks...")
-if query:
-    with st.chat_message("user"):
-        st.write(query)
-
+# Only a new query runs the agent; other reruns (expander toggles etc.) re-render the stored answer
+if query and st.session_state.get("last_query") != query:
     try:
+        with st.chat_message("user"):
+            st.write(query)
         with st.chat_message("assistant"):
-            with st.spinner("Sourcing data and generating report..."):
-                response = agent.run(query)
-                st.write(response)
-                # Add the Q&A pair to chat history
-                # st.session_state.chat_history.append((query, response))
+            with st.status("Sourcing data and generating report...") as status:
+                agent = get_agent()
+                st.session_state.last_response = run_streaming(agent, query, status)
+                status.update(label="Report ready", state="complete", expanded=False)
+            st.session_state.last_query = query
+            st.write(st.session_state.last_response)
+            # Add the Q&A pair to chat history
+            # st.session_state.chat_history.append((query, response))
     except Exception as e:
         st.error(f"Error: {str(e)}")
+elif "last_response" in st.session_state:
+    with st.chat_message("user"):
+        st.write(st.session_state.last_query)
+    with st.chat_message("assistant"):
+        st.write(st.session_state.last_response)
 
 #Please analyze the Total Equity break using Trade Activity and Positions. I need to explain difference between Closing Equity (Calc) & Closing Equity (Reported)
\ No newline at end of file
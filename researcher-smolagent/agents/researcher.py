@@ -9,7 +9,9 @@ from config import get_model
 from tools import (
     web_search,
     scrape_webpage,
+    scrape_webpages,
     analyze_document,
+    analyze_documents,
     synthesize_data,
     track_citations
 )
@@ -26,7 +28,9 @@ def create_researcher_agent() -> ToolCallingAgent:
     Tools included:
         - web_search: Search the web using DuckDuckGo
         - scrape_webpage: Extract content from webpages
+        - scrape_webpages: Extract content from several webpages concurrently
         - analyze_document: Analyze PDFs and documents
+        - analyze_documents: Analyze several documents in parallel
         - synthesize_data: Aggregate information from multiple sources
         - track_citations: Extract and manage citations
 
@@ -38,7 +42,9 @@ def create_researcher_agent() -> ToolCallingAgent:
         tools=[
             web_search,
             scrape_webpage,
+            scrape_webpages,
             analyze_document,
+            analyze_documents,
             synthesize_data,
             track_citations
         ],
@@ -0,0 +1,357 @@
+"""
+LLM response cache for the researcher and council agents.
+
+Two tiers:
+1. Exact match - SHA-256 of (model_id, prompt) in an in-memory LRU with a TTL
+2. Semantic match - cosine similarity of prompt embeddings (optional,
+   needs sentence-transformers) for near-duplicate research queries
+
+Also persists accepted workflow results per normalized query, so a repeated
+query can skip the whole research/review pipeline, and an embedding index of
+accepted reports so related queries can build on earlier research.
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from smolagents.memory import ActionStep
+from config import LLM_CACHE_TTL_SECONDS
+
+# Sentence embedding model used for the semantic tier
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Accepted workflow results, one JSON file per normalized query
+TASK_CACHE_DIR = os.path.join(os.getenv("CACHE_DIR", "data/research_cache"), "tasks")
+
+# Accepted reports with an embedding of their query, for related-query lookups
+REPORT_INDEX_PATH = os.path.join(os.getenv("CACHE_DIR", "data/research_cache"), "report_index.json")
+
+
+class LLMCache:
+    """
+    In-process cache of agent responses keyed by model and prompt.
+
+    The semantic tier is only consulted for lookups that opt in, and is
+    disabled automatically if sentence-transformers is not installed.
+    """
+
+    def __init__(self, max_entries: int = 256, similarity_threshold: float = 0.92, ttl_seconds: int = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept per tier
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            ttl_seconds: Age after which a stored response is no longer served
+        """
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+        self._exact = OrderedDict()  # prompt hash -> (response, stored_at)
+        self._semantic = {}  # model_id -> OrderedDict(prompt hash -> (vector, response, stored_at))
+        self._encoder = None
+        self._semantic_available = True
+        # Lookups run in worker threads, possibly several at once
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(prompt: str, model_id: str) -> str:
+        return hashlib.sha256(f"{model_id}\n{prompt}".encode()).hexdigest()
+
+    def _embed(self, text: str):
+        """Return a normalized embedding for text, or None if the semantic tier is unavailable."""
+        if not self._semantic_available:
+            return None
+        if self._encoder is None:
+            try:
+                # Import here to avoid dependency issues if not installed
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(EMBEDDING_MODEL)
+            except ImportError:
+                self._semantic_available = False
+                return None
+        return self._encoder.encode(text, normalize_embeddings=True)
+
+    def get(self, prompt: str, model_id: str, semantic: bool = False):
+        """
+        Look up a cached response.
+
+        Args:
+            prompt: The prompt sent to the agent
+            model_id: Model the agent runs on
+            semantic: Also accept a near-duplicate prompt from the semantic tier
+
+        Returns:
+            str or None: Cached response, or None on a miss
+        """
+        with self._lock:
+            response = self._get(prompt, model_id, semantic)
+            self.stats["misses" if response is None else "hits"] += 1
+            return response
+
+    def _get(self, prompt: str, model_id: str, semantic: bool):
+        expired_before = time.time() - self.ttl_seconds
+        key = self._key(prompt, model_id)
+        if key in self._exact:
+            response, stored_at = self._exact[key]
+            if stored_at >= expired_before:
+                self._exact.move_to_end(key)
+                return response
+            del self._exact[key]
+
+        entries = self._semantic.get(model_id)
+        if not semantic or not entries:
+            return None
+        for stale in [k for k, entry in entries.items() if entry[2] < expired_before]:
+            del entries[stale]
+        if not entries:
+            return None
+        vector = self._embed(prompt)
+        if vector is None:
+            return None
+
+        import numpy as np
+        keys = list(entries)
+        matrix = np.vstack([entries[k][0] for k in keys])
+        similarities = matrix @ vector
+        best = int(similarities.argmax())
+        if similarities[best] >= self.similarity_threshold:
+            entries.move_to_end(keys[best])
+            return entries[keys[best]][1]
+        return None
+
+    def set(self, prompt: str, model_id: str, response: str, semantic: bool = False):
+        """
+        Store a response.
+
+        Args:
+            prompt: The prompt sent to the agent
+            model_id: Model the agent runs on
+            response: The agent's response
+            semantic: Also index the prompt in the semantic tier
+        """
+        with self._lock:
+            self._set(prompt, model_id, response, semantic)
+
+    def _set(self, prompt: str, model_id: str, response: str, semantic: bool):
+        key = self._key(prompt, model_id)
+        stored_at = time.time()
+        self._exact[key] = (response, stored_at)
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+        if semantic:
+            vector = self._embed(prompt)
+            if vector is not None:
+                entries = self._semantic.setdefault(model_id, OrderedDict())
+                entries[key] = (vector, response, stored_at)
+                if len(entries) > self.max_entries:
+                    entries.popitem(last=False)
+
+
+llm_cache = LLMCache(ttl_seconds=LLM_CACHE_TTL_SECONDS)
+
+
+async def _run_streaming(agent, prompt: str, on_step):
+    """
+    Run an agent in a worker thread, awaiting on_step for each action step as it completes.
+
+    Returns:
+        The agent's final answer (the last item of the streamed run)
+    """
+    loop = asyncio.get_running_loop()
+    steps = asyncio.Queue()
+
+    def worker():
+        result = None
+        try:
+            for result in agent.run(prompt, stream=True):
+                if isinstance(result, ActionStep):
+                    loop.call_soon_threadsafe(steps.put_nowait, result)
+        finally:
+            loop.call_soon_threadsafe(steps.put_nowait, None)
+        return result
+
+    run = asyncio.ensure_future(asyncio.to_thread(worker))
+    while (step := await steps.get()) is not None:
+        await on_step(step)
+    return await run
+
+
+async def cached_run(agent, prompt: str, semantic: bool = False, on_step=None, executor=None, run=None) -> str:
+    """
+    Run an agent through the shared response cache.
+
+    Args:
+        agent: A smolagents agent
+        prompt: Prompt to run
+        semantic: Allow near-duplicate prompt hits. Only safe where the prompt
+                  is the user's question (researcher), not a report under review.
+        on_step: Optional coroutine function called with each ActionStep as the
+                 agent completes it (not called on a cache hit)
+        executor: Optional concurrent.futures executor for the agent run
+                  (default: asyncio's thread pool; ignored when streaming steps)
+        run: Optional callable run with the prompt in place of agent.run, e.g. a
+             picklable stand-in for a process pool executor
+
+    Returns:
+        str: Cached or freshly generated response
+    """
+    # Agents sharing a model still differ by system prompt, so key on both
+    model_id = f"{agent.model.model_id}:{hash(agent.system_prompt)}"
+    if semantic:
+        # Embedding can load a model on first use; keep it off the event loop
+        cached = await asyncio.to_thread(llm_cache.get, prompt, model_id, True)
+    else:
+        # Exact tier only: a hash and dict lookup, cheaper inline than a thread handoff
+        cached = llm_cache.get(prompt, model_id)
+    if cached is not None:
+        return cached
+
+    if on_step is not None:
+        response = await _run_streaming(agent, prompt, on_step)
+    elif executor is not None:
+        response = await asyncio.get_running_loop().run_in_executor(executor, run or agent.run, prompt)
+    else:
+        response = await asyncio.to_thread(agent.run, prompt)
+    if semantic:
+        await asyncio.to_thread(llm_cache.set, prompt, model_id, response, True)
+    else:
+        llm_cache.set(prompt, model_id, response)
+    return response
+
+
+def _task_cache_path(query: str) -> str:
+    """Cache file for a query, ignoring case and whitespace differences."""
+    normalized = " ".join(query.lower().split())
+    return os.path.join(TASK_CACHE_DIR, f"{hashlib.sha256(normalized.encode()).hexdigest()}.json")
+
+
+def load_task_result(query: str, max_age_hours: float) -> dict:
+    """
+    Load a previously accepted workflow result for query, if fresh.
+
+    Args:
+        query: The research query
+        max_age_hours: Maximum age of a usable result
+
+    Returns:
+        dict or None: The stored execute_research result
+    """
+    cache_path = _task_cache_path(query)
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+                age_hours = (time.time() - cached.get('timestamp', 0)) / 3600
+                if age_hours < max_age_hours:
+                    return cached.get('data')
+        except (json.JSONDecodeError, ValueError, TypeError):
+            # TypeError: an older entry with an ISO timestamp string; treated as a miss
+            pass
+    return None
+
+
+def save_task_result(query: str, result: dict):
+    """Persist an accepted workflow result for query."""
+    try:
+        os.makedirs(TASK_CACHE_DIR, exist_ok=True)
+        with open(_task_cache_path(query), 'w') as f:
+            json.dump({
+                'timestamp': time.time(),
+                'data': result
+            }, f)
+    except Exception as e:
+        print(f"Task cache save failed: {e}")
+
+
+class ReportIndex:
+    """
+    Accepted research reports indexed by an embedding of their query.
+
+    Persisted as JSON so related queries in later sessions can reuse earlier
+    research. Shares the response cache's sentence-transformers encoder;
+    without it, searches return nothing and nothing is indexed.
+    """
+
+    def __init__(self, path: str = REPORT_INDEX_PATH, max_entries: int = 200):
+        """
+        Initialize the index (loaded from disk on first use).
+
+        Args:
+            path: JSON file the index is persisted to
+            max_entries: Maximum number of reports kept, oldest dropped first
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = None  # [{'query', 'report', 'vector'}], oldest first
+        self._lock = threading.Lock()
+
+    def _load(self) -> list:
+        if self._entries is None:
+            self._entries = []
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r') as f:
+                        self._entries = json.load(f)
+                except (json.JSONDecodeError, ValueError):
+                    pass
+        return self._entries
+
+    def search(self, query: str, k: int = 3, threshold: float = 0.85) -> list:
+        """
+        Find accepted reports whose query is similar to query.
+
+        Args:
+            query: The research query
+            k: Maximum number of reports returned
+            threshold: Minimum cosine similarity between queries
+
+        Returns:
+            list: [{'query': str, 'report': str}], most similar first
+        """
+        with self._lock:
+            entries = self._load()
+            if not entries:
+                return []
+            vector = llm_cache._embed(query)
+            if vector is None:
+                return []
+
+            import numpy as np
+            similarities = np.asarray([entry['vector'] for entry in entries], dtype=np.float32) @ vector
+            best = similarities.argsort()[::-1][:k]
+            return [
+                {'query': entries[i]['query'], 'report': entries[i]['report']}
+                for i in best
+                if similarities[i] >= threshold
+            ]
+
+    def add(self, query: str, report: str):
+        """Index an accepted report, replacing any earlier report for the same query."""
+        with self._lock:
+            vector = llm_cache._embed(query)
+            if vector is None:
+                return
+            normalized = " ".join(query.lower().split())
+            entries = [
+                entry for entry in self._load()
+                if " ".join(entry['query'].lower().split()) != normalized
+            ]
+            entries.append({'query': query, 'report': report, 'vector': vector.tolist()})
+            self._entries = entries[-self.max_entries:]
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, 'w') as f:
+                    json.dump(self._entries, f)
+            except Exception as e:
+                print(f"Report index save failed: {e}")
+
+
+report_index = ReportIndex()
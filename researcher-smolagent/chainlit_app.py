@@ -12,62 +12,72 @@ import chainlit as cl
 import asyncio
 import os
 import re
-from datetime import datetime
-from fpdf import FPDF
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from agents.researcher import create_researcher_agent
 from agents.council import create_council_agents, get_reviewer_names
-from orchestration.workflow import ResearchOrchestrator
-from config import get_all_model_info
-
-
-class ResearchPDF(FPDF):
-    """Custom PDF class for research reports."""
-
-    def __init__(self):
-        super().__init__()
-        self.set_auto_page_break(auto=True, margin=15)
-
-    def header(self):
-        self.set_font('Helvetica', 'B', 12)
-        self.cell(0, 10, 'Research Report - Multi-Agent Research System', align='C', ln=True)
-        self.ln(5)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font('Helvetica', 'I', 8)
-        self.cell(0, 10, f'Page {self.page_no()}', align='C')
-
-    def add_title(self, title: str):
-        self.set_font('Helvetica', 'B', 16)
-        self.multi_cell(0, 10, title)
-        self.ln(5)
-
-    def add_section(self, title: str, content: str):
-        self.set_font('Helvetica', 'B', 12)
-        self.set_fill_color(240, 240, 240)
-        self.cell(0, 8, title, fill=True, ln=True)
-        self.ln(2)
-        self.set_font('Helvetica', '', 10)
-        # Clean content of problematic characters
-        clean_content = content.encode('latin-1', 'replace').decode('latin-1')
-        self.multi_cell(0, 5, clean_content)
-        self.ln(5)
-
-    def add_review(self, reviewer: str, score: float, recommendation: str, review_text: str):
-        # Reviewer name
-        self.set_font('Helvetica', 'B', 11)
-        status = "PASS" if score >= 3.0 else "NEEDS IMPROVEMENT"
-        self.cell(0, 7, f"{reviewer}", ln=True)
-
-        # Score and recommendation
-        self.set_font('Helvetica', '', 10)
-        self.cell(0, 5, f"Score: {score:.1f}/5.0 | Status: {status} | Recommendation: {recommendation}", ln=True)
-        self.ln(2)
-
-        # Review text
-        clean_text = review_text.encode('latin-1', 'replace').decode('latin-1')
-        self.multi_cell(0, 5, clean_text)
-        self.ln(5)
+from orchestration.workflow import ResearchOrchestrator, collect_council_reviews
+from config import get_all_model_info, COUNCIL_CONCURRENCY
+from cache import cached_run
+
+
+# Maximum characters of a report shown in a step output
+_TRUNC_LEN = 500
+
+
+def _truncate(text: str, limit: int = _TRUNC_LEN) -> str:
+    """Shorten text for step outputs, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Characters stripped from the query when building the PDF file name
+_SAFE_QUERY_RE = re.compile(r'[^\w\s-]')
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> dict:
+    """Build the PDF paragraph styles once per process and reuse them for every report."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        'title': styles['Title'],
+        'heading': styles['Heading2'],
+        'reviewer': styles['Heading4'],
+        'body': styles['BodyText'],
+        'section': ParagraphStyle('Section', parent=styles['Heading3'], backColor=colors.HexColor('#F0F0F0')),
+        'meta': ParagraphStyle('Meta', parent=styles['BodyText'], fontName='Helvetica-Oblique', fontSize=9),
+    }
+
+
+def _draw_page_frame(canvas, doc):
+    """Draw the report header and page-number footer on every page."""
+    from reportlab.lib.units import mm
+
+    width, height = doc.pagesize
+    canvas.saveState()
+    canvas.setFont('Helvetica-Bold', 12)
+    canvas.drawCentredString(width / 2, height - 12 * mm, 'Research Report - Multi-Agent Research System')
+    canvas.setFont('Helvetica-Oblique', 8)
+    canvas.drawCentredString(width / 2, 10 * mm, f'Page {doc.page}')
+    canvas.restoreState()
+
+
+def _text_paragraphs(text: str, style) -> list:
+    """Split plain text into escaped Paragraph flowables, one per blank-line separated block."""
+    from reportlab.platypus import Paragraph
+
+    return [
+        Paragraph(escape(block.strip()).replace('\n', '<br/>'), style)
+        for block in text.split('\n\n')
+        if block.strip()
+    ]
+
+
+def _format_score(score) -> str:
+    """A review score as shown to the user; "n/a" for a review cancelled after an early accept."""
+    return "n/a" if score is None else f"{score:.1f}"
 
 
 def generate_research_pdf(query: str, research_report: str, reviews: list, scores: list, iteration: int) -> str:
@@ -84,47 +94,148 @@ def generate_research_pdf(query: str, research_report: str, reviews: list, score
     Returns:
         str: Path to the generated PDF file
     """
-    pdf = ResearchPDF()
-    pdf.add_page()
-
-    # Title
-    pdf.add_title(f"Research: {query[:100]}{'...' if len(query) > 100 else ''}")
-
-    # Metadata
-    pdf.set_font('Helvetica', 'I', 9)
-    pdf.cell(0, 5, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
-    pdf.cell(0, 5, f"Total Iterations: {iteration}", ln=True)
-    passing = sum(1 for s in scores if s >= 3.0)
-    pdf.cell(0, 5, f"Final Status: {'Accepted' if passing >= 2 else 'Max Iterations Reached'} ({passing}/3 passing reviews)", ln=True)
-    pdf.ln(10)
-
-    # Research Report
-    pdf.add_section("Research Report", research_report)
-
-    # Council Reviews
-    pdf.add_page()
-    pdf.set_font('Helvetica', 'B', 14)
-    pdf.cell(0, 10, "Council Reviews", ln=True)
-    pdf.ln(5)
+    # Import here so ReportLab is only loaded by sessions that produce a PDF
+    from datetime import datetime
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+
+    styles = _pdf_styles()
+
+    passing = sum(1 for s in scores if s is not None and s >= 3.0)
+    story = [
+        # Title
+        Paragraph(escape(f"Research: {query[:100]}{'...' if len(query) > 100 else ''}"), styles['title']),
+        # Metadata
+        Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['meta']),
+        Paragraph(f"Total Iterations: {iteration}", styles['meta']),
+        Paragraph(f"Final Status: {'Accepted' if passing >= 2 else 'Max Iterations Reached'} ({passing}/3 passing reviews)", styles['meta']),
+        Spacer(1, 10 * mm),
+        # Research Report
+        Paragraph("Research Report", styles['section']),
+        *_text_paragraphs(research_report, styles['body']),
+        # Council Reviews
+        PageBreak(),
+        Paragraph("Council Reviews", styles['heading']),
+    ]
 
     for review in reviews:
-        pdf.add_review(
-            reviewer=review['reviewer'],
-            score=review['score'],
-            recommendation=review['recommendation'],
-            review_text=review['review_text']
-        )
+        if review['score'] is None:
+            status = "NOT REVIEWED"
+        else:
+            status = "PASS" if review['score'] >= 3.0 else "NEEDS IMPROVEMENT"
+        story.append(Paragraph(escape(review['reviewer']), styles['reviewer']))
+        story.append(Paragraph(
+            f"Score: {_format_score(review['score'])}/5.0 | Status: {status} | Recommendation: {escape(review['recommendation'])}",
+            styles['body']
+        ))
+        story.extend(_text_paragraphs(review['review_text'], styles['body']))
+        story.append(Spacer(1, 5 * mm))
 
     # Save PDF
     os.makedirs("data/exports", exist_ok=True)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    safe_query = re.sub(r'[^\w\s-]', '', query[:30]).strip().replace(' ', '_')
+    safe_query = _SAFE_QUERY_RE.sub('', query[:30]).strip().replace(' ', '_')
     filename = f"data/exports/research_{safe_query}_{timestamp}.pdf"
-    pdf.output(filename)
+    doc = SimpleDocTemplate(filename, pagesize=A4, topMargin=20 * mm, bottomMargin=18 * mm)
+    doc.build(story, onFirstPage=_draw_page_frame, onLaterPages=_draw_page_frame)
 
     return filename
 
 
+# Review criterion per reviewer, parsed once from "Name (Criterion)"
+REVIEWER_CRITERIA = [name.split('(', 1)[1].rstrip(')') for name in get_reviewer_names()]
+
+_llm_semaphore = None
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the shared semaphore bounding concurrent council LLM calls, created on first use."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(COUNCIL_CONCURRENCY)
+    return _llm_semaphore
+
+
+def _step_streamer(msg: cl.Message):
+    """
+    Build an on_step callback that appends each completed researcher tool call to msg.
+
+    smolagents streams whole agent steps rather than tokens, so this is step-level progress.
+    """
+    async def on_step(step):
+        for call in step.tool_calls or []:
+            if call.name == "final_answer":
+                continue
+            arguments = str(call.arguments)
+            if len(arguments) > 120:
+                arguments = arguments[:120] + "..."
+            await msg.stream_token(f"- Step {step.step_number}: `{call.name}` {arguments}\n")
+    return on_step
+
+
+def _review_summary(review: dict) -> str:
+    """One-line, score-coded summary of a review for its reviewer step output."""
+    if review['recommendation'] in ('ERROR', 'CANCELLED'):
+        return f"{review['reviewer']}: {review['review_text']}"
+
+    # Color code based on score
+    if review['score'] >= 4.0:
+        score_emoji = "✅"
+    elif review['score'] >= 3.0:
+        score_emoji = "✓"
+    else:
+        score_emoji = "⚠️"
+
+    return f"{score_emoji} {review['reviewer']}: Score {review['score']:.1f}/5.0 - {review['recommendation']}"
+
+
+async def _run_single_review(orchestrator, i: int, name: str, research_report: str, parent_id: str) -> dict:
+    """
+    Run one council reviewer in its own step.
+
+    Args:
+        orchestrator: The session's ResearchOrchestrator
+        i: Index of the reviewer in orchestrator.council
+        name: Reviewer display name
+        research_report: The research report to review
+        parent_id: Id of the enclosing council step
+
+    Returns:
+        dict: Review with reviewer, review_text, score and recommendation
+    """
+    async with cl.Step(name=f"{name} Review", type="llm", parent_id=parent_id) as review_step:
+        review_step.input = f"Evaluating based on {REVIEWER_CRITERIA[i]}..."
+
+        try:
+            async with _get_llm_semaphore():
+                review_text = await cached_run(orchestrator.council[i], research_report)
+
+            score, recommendation = orchestrator._parse_review(review_text)
+            review = {
+                'reviewer': name,
+                'review_text': review_text,
+                'score': score,
+                'recommendation': recommendation
+            }
+
+        except asyncio.CancelledError:
+            # The council accepted the research before this review finished
+            review_step.output = "Review not needed: 2 reviewers had already accepted the research."
+            raise
+
+        except Exception as e:
+            review = {
+                'reviewer': name,
+                'review_text': f"Error: {str(e)}",
+                'score': 0.0,
+                'recommendation': 'ERROR'
+            }
+
+        review_step.output = _review_summary(review)
+        return review
+
+
 @cl.on_chat_start
 async def start():
     """
@@ -168,11 +279,12 @@ Example queries:
 
     # Display model information
     model_info = get_all_model_info()
-    model_msg = "## Models in Use:\n\n"
+    model_parts = ["## Models in Use:\n\n"]
     for role, info in model_info.items():
         role_name = role.replace('_', ' ').title()
-        model_msg += f"**{role_name}**: {info['model_id']}\n"
-        model_msg += f"  *{info['description']}*\n\n"
+        model_parts.append(f"**{role_name}**: {info['model_id']}\n")
+        model_parts.append(f"  *{info['description']}*\n\n")
+    model_msg = "".join(model_parts)
 
     await cl.Message(content=model_msg).send()
 
@@ -215,6 +327,7 @@ async def main(message: cl.Message):
 
         research_report = None
         all_reviews = []
+        feedback_task = None
 
         while iteration < 2:  # Max 2 iterations
             # Phase 1: Research
@@ -222,11 +335,18 @@ async def main(message: cl.Message):
                 async with cl.Step(name="Initial Research", type="llm", parent_id=workflow_step.id) as research_step:
                     research_step.input = query
 
-                    await cl.Message(content=f"**Phase 1: Conducting Research** (Iteration {iteration + 1}/2)\n\nThe researcher is gathering information...").send()
+                    progress_msg = cl.Message(content=f"**Phase 1: Conducting Research** (Iteration {iteration + 1}/2)\n\nThe researcher is gathering information...\n\n")
+                    await progress_msg.send()
 
                     try:
-                        research_report = await asyncio.to_thread(orchestrator.researcher.run, query)
-                        research_step.output = research_report[:500] + "..." if len(research_report) > 500 else research_report
+                        prompt = await orchestrator._research_prompt(query)
+                        # Rephrasings of an earlier question may be served from the semantic cache,
+                        # but only a bare query is safe to match that loosely
+                        research_report = await cached_run(
+                            orchestrator.researcher, prompt, semantic=(prompt == query),
+                            on_step=_step_streamer(progress_msg)
+                        )
+                        research_step.output = _truncate(research_report)
 
                     except Exception as e:
                         research_step.output = f"Error: {str(e)}"
@@ -236,71 +356,52 @@ async def main(message: cl.Message):
             else:
                 # Revision phase
                 async with cl.Step(name="Research Revision", type="llm", parent_id=workflow_step.id) as revision_step:
-                    feedback = orchestrator._synthesize_feedback(all_reviews[-1])
+                    feedback = await feedback_task
                     revision_prompt = orchestrator._create_revision_prompt(query, research_report, feedback)
                     revision_step.input = "Revising research with council feedback..."
 
-                    await cl.Message(content=f"**Phase 1 (Revision): Improving Research** (Iteration {iteration + 1}/2)\n\nThe researcher is addressing council feedback...").send()
+                    progress_msg = cl.Message(content=f"**Phase 1 (Revision): Improving Research** (Iteration {iteration + 1}/2)\n\nThe researcher is addressing council feedback...\n\n")
+                    await progress_msg.send()
 
                     try:
-                        research_report = await asyncio.to_thread(orchestrator.researcher.run, revision_prompt)
-                        revision_step.output = research_report[:500] + "..." if len(research_report) > 500 else research_report
+                        research_report = await cached_run(
+                            orchestrator.researcher, revision_prompt, on_step=_step_streamer(progress_msg)
+                        )
+                        revision_step.output = _truncate(research_report)
 
                     except Exception as e:
                         revision_step.output = f"Error: {str(e)}"
                         await cl.Message(content=f"Revision failed: {str(e)}").send()
                         return
 
-            # Display research report
-            await cl.Message(content=f"## Research Complete\n\n{research_report}").send()
+            # Display research report as an attached element rather than inline message text
+            report_msg = cl.Message(content=f"## Research Complete (Iteration {iteration + 1})")
+            await report_msg.send()
+            report_msg.elements = [
+                cl.Text(name=f"research_report_{iteration + 1}.md", content=research_report, display="inline")
+            ]
+            await report_msg.update()
 
             # Phase 2: Council Review
             async with cl.Step(name="Council Review", type="tool", parent_id=workflow_step.id) as council_step:
-                council_step.input = "Reviewing research quality..."
+                council_step.input = f"Reviewing research quality ({', '.join(REVIEWER_CRITERIA)})..."
 
                 await cl.Message(content=f"**Phase 2: Council Review** (Iteration {iteration + 1}/2)\n\n3 expert reviewers are independently assessing the research...").send()
 
                 reviewer_names = get_reviewer_names()
-                reviews = []
-
-                # Visualize each reviewer
-                for i, name in enumerate(reviewer_names):
-                    async with cl.Step(name=f"{name} Review", type="llm", parent_id=council_step.id) as review_step:
-                        review_step.input = f"Evaluating based on {name.split('(')[1].replace(')', '')}..."
-
-                        try:
-                            review_text = await asyncio.to_thread(orchestrator.council[i].run, research_report)
-                            score = orchestrator._extract_score(review_text)
-                            recommendation = orchestrator._extract_recommendation(review_text)
-
-                            reviews.append({
-                                'reviewer': name,
-                                'review_text': review_text,
-                                'score': score,
-                                'recommendation': recommendation
-                            })
-
-                            # Color code based on score
-                            if score >= 4.0:
-                                score_emoji = "✅"
-                            elif score >= 3.0:
-                                score_emoji = "✓"
-                            else:
-                                score_emoji = "⚠️"
-
-                            review_step.output = f"{score_emoji} Score: {score:.1f}/5.0 - {recommendation}"
-
-                        except Exception as e:
-                            reviews.append({
-                                'reviewer': name,
-                                'review_text': f"Error: {str(e)}",
-                                'score': 0.0,
-                                'recommendation': 'ERROR'
-                            })
-                            review_step.output = f"Error: {str(e)}"
+
+                # Visualize each reviewer; the three reviews are independent, so run them
+                # concurrently, and stop waiting once 2 have accepted the research
+                review_tasks = {
+                    asyncio.create_task(_run_single_review(orchestrator, i, name, research_report, council_step.id)): i
+                    for i, name in enumerate(reviewer_names)
+                }
+                reviews, _ = await collect_council_reviews(review_tasks, reviewer_names)
 
                 scores = [r['score'] for r in reviews]
-                council_step.output = f"All reviews complete. Scores: {[f'{s:.1f}' for s in scores]}"
+                # Formatted once and reused by the step output and the decision messages
+                scores_text = ', '.join(map(_format_score, scores))
+                council_step.output = f"All reviews complete. Scores: [{scores_text}]"
 
                 all_reviews.append({
                     'iteration': iteration + 1,
@@ -309,24 +410,41 @@ async def main(message: cl.Message):
                 })
 
             # Phase 3: Decision
-            passing = sum(1 for score in scores if score >= 3.0)
+            passing = sum(1 for score in scores if score is not None and score >= 3.0)
             accept = passing >= 2
 
+            if not accept and iteration < 1:
+                # Synthesize revision feedback while the review messages below are sent
+                feedback_task = asyncio.create_task(
+                    asyncio.to_thread(orchestrator._synthesize_feedback, all_reviews[-1])
+                )
+
             # Display council reviews
-            reviews_msg = f"## Council Review Results (Iteration {iteration + 1})\n\n"
+            reviews_parts = [f"## Council Review Results (Iteration {iteration + 1})\n\n"]
             for review in reviews:
-                score_indicator = "🟢" if review['score'] >= 3.0 else "🔴"
-                reviews_msg += f"### {score_indicator} {review['reviewer']}\n"
-                reviews_msg += f"**Score**: {review['score']:.1f}/5.0 | **Recommendation**: {review['recommendation']}\n\n"
-                reviews_msg += f"{review['review_text']}\n\n---\n\n"
-
-            await cl.Message(content=reviews_msg).send()
+                if review['score'] is None:
+                    score_indicator = "⚪"
+                else:
+                    score_indicator = "🟢" if review['score'] >= 3.0 else "🔴"
+                reviews_parts.append(f"### {score_indicator} {review['reviewer']}\n")
+                reviews_parts.append(f"**Score**: {_format_score(review['score'])}/5.0 | **Recommendation**: {review['recommendation']}\n\n")
+            reviews_msg = "".join(reviews_parts)
+
+            # Full review texts are attached as elements, opened from the side panel
+            await cl.Message(
+                content=reviews_msg,
+                elements=[
+                    cl.Text(name=review['reviewer'], content=review['review_text'], display="side")
+                    for review in reviews
+                ]
+            ).send()
 
             # Decision message
             if accept:
+                await orchestrator._index_accepted(query, research_report)
                 decision_msg = f"""## ✅ Research Accepted!
 
-**Final Scores**: {', '.join([f'{s:.1f}' for s in scores])}
+**Final Scores**: {scores_text}
 **Passing Reviews**: {passing}/3
 
 The research has met the quality standards ({passing} reviewers scored 3.0 or higher).
@@ -337,7 +455,9 @@ The research has met the quality standards ({passing} reviewers scored 3.0 or hi
 
                 # Generate and offer PDF download
                 try:
-                    pdf_path = generate_research_pdf(
+                    # Layout and disk write happen off the event loop
+                    pdf_path = await asyncio.to_thread(
+                        generate_research_pdf,
                         query=query,
                         research_report=research_report,
                         reviews=reviews,
@@ -359,7 +479,7 @@ The research has met the quality standards ({passing} reviewers scored 3.0 or hi
                 # Needs revision
                 revision_msg = f"""## 🔄 Revision Requested
 
-**Current Scores**: {', '.join([f'{s:.1f}' for s in scores])}
+**Current Scores**: {scores_text}
 **Passing Reviews**: {passing}/3
 
 All reviewers scored below 3.0. The researcher will now revise the research based on council feedback.
@@ -374,7 +494,7 @@ All reviewers scored below 3.0. The researcher will now revise the research base
                 # Max iterations reached
                 final_msg = f"""## ⏭️ Maximum Iterations Reached
 
-**Final Scores**: {', '.join([f'{s:.1f}' for s in scores])}
+**Final Scores**: {scores_text}
 **Passing Reviews**: {passing}/3
 
 The research has been through {iteration + 1} iterations. While it didn't fully meet the acceptance criteria, this is the final version.
@@ -385,7 +505,9 @@ Consider the council feedback for future research improvements.
 
                 # Generate and offer PDF download
                 try:
-                    pdf_path = generate_research_pdf(
+                    # Layout and disk write happen off the event loop
+                    pdf_path = await asyncio.to_thread(
+                        generate_research_pdf,
                         query=query,
                         research_report=research_report,
                         reviews=reviews,
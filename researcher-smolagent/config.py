@@ -7,11 +7,34 @@ Defines OpenRouter model configurations for:
 """
 
 import os
+from functools import lru_cache
 from smolagents import OpenAIServerModel
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Maximum number of council LLM calls in flight at once (OpenRouter rate limits)
+COUNCIL_CONCURRENCY = int(os.getenv("COUNCIL_CONCURRENCY", "3"))
+
+# How long an accepted research result is reused for a repeated query (0 disables)
+TASK_CACHE_TTL_HOURS = float(os.getenv("TASK_CACHE_TTL_HOURS", "24"))
+
+# How long an in-memory agent response (cache.llm_cache) is reused, in seconds
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+
+# Skip the council for a report whose opening (first 2048 chars) was accepted in this
+# many consecutive rounds; 0 (default) always runs the council
+COUNCIL_SKIP_AFTER_ACCEPTS = int(os.getenv("COUNCIL_SKIP_AFTER_ACCEPTS", "0"))
+
+# Number of accepted reports on similar earlier queries given to the researcher as
+# context (0 disables; needs sentence-transformers)
+RELATED_REPORTS = int(os.getenv("RELATED_REPORTS", "0"))
+
+# Where council reviews run: "thread" (default; reviews are I/O-bound API calls) or
+# "process" to sidestep the GIL when agents do local CPU work; each worker process
+# builds its own council agents.
+COUNCIL_EXECUTOR = os.getenv("COUNCIL_EXECUTOR", "thread")
+
 # Model configurations for different agent roles
 MODEL_CONFIGS = {
     "researcher": {
@@ -41,16 +64,23 @@ MODEL_CONFIGS = {
 }
 
 
+# Shared model instances keyed by (model_id, api_base), so roles and sessions on
+# the same model reuse one OpenAI client and its connection pool
+_MODEL_INSTANCES: dict = {}
+
+
 def get_model(config_key: str) -> OpenAIServerModel:
     """
-    Create and return a configured OpenAIServerModel for the specified agent role.
+    Return the shared OpenAIServerModel for the specified agent role.
+
+    Roles configured with the same model_id get the same instance.
 
     Args:
         config_key (str): One of "researcher", "council_methodology",
                          "council_comprehensiveness", "council_clarity"
 
     Returns:
-        OpenAIServerModel: Configured model instance
+        OpenAIServerModel: Configured (shared) model instance
 
     Raises:
         KeyError: If config_key is not valid
@@ -67,17 +97,24 @@ def get_model(config_key: str) -> OpenAIServerModel:
             "Please set it in your .env file."
         )
 
-    return OpenAIServerModel(
-        model_id=config["model_id"],
-        api_base=config["api_base"],
-        api_key=config["api_key"]
-    )
+    instance_key = (config["model_id"], config["api_base"])
+    if instance_key not in _MODEL_INSTANCES:
+        _MODEL_INSTANCES[instance_key] = OpenAIServerModel(
+            model_id=config["model_id"],
+            api_base=config["api_base"],
+            api_key=config["api_key"]
+        )
+    return _MODEL_INSTANCES[instance_key]
 
 
+@lru_cache(maxsize=1)
 def get_all_model_info() -> dict:
     """
     Get information about all configured models.
 
+    MODEL_CONFIGS is fixed at import, so the result is built once and shared;
+    callers must not mutate it.
+
     Returns:
         dict: Model information for all agent roles
     """
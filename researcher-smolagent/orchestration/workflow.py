@@ -12,8 +12,282 @@ Workflow:
 """
 
 import re
+import atexit
+import logging
 import asyncio
-from typing import Dict, List
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Dict, List, Mapping
+
+from cache import cached_run, llm_cache, load_task_result, save_task_result, report_index
+from config import TASK_CACHE_TTL_HOURS, COUNCIL_SKIP_AFTER_ACCEPTS, COUNCIL_EXECUTOR, RELATED_REPORTS
+
+logger = logging.getLogger(__name__)
+
+# Review parsing pattern, compiled once. A single scan finds score lines
+# ("Overall Score: X.X / 5", "Overall Score: X", "Score: X/5") and recommendations.
+_REVIEW_RE = re.compile(
+    r'(?P<overall>Overall )?Score:\s*(?P<score>\d+\.?\d*)(?P<out_of>\s*/\s*5)?'
+    r'|Recommendation:\s*(?P<recommendation>ACCEPT|REVISE)',
+    re.IGNORECASE
+)
+
+# Review section header: "## Name" or "### Name"
+_SECTION_HEADER_RE = re.compile(r'^#{2,3}\s+(.*)')
+
+
+
+def _score_rank(match: re.Match):
+    """
+    Precedence of a _REVIEW_RE score match, lower is better.
+
+    0 = "Overall Score: X / 5", 1 = "Overall Score: X", 2 = "Score: X / 5";
+    None for a recommendation or a bare "Score: X", which is not a score line.
+    """
+    if match.group('recommendation'):
+        return None
+    if match.group('overall'):
+        return 0 if match.group('out_of') else 1
+    if match.group('out_of'):
+        return 2
+    return None
+
+
+@lru_cache(maxsize=16)
+def _parse_sections(text: str) -> Mapping[str, str]:
+    """
+    Split review text into sections in one pass over its lines.
+
+    A section starts at a "## Name" or "### Name" header and runs to the next
+    one. Text after a colon on the header line ("### Recommendation: ACCEPT")
+    starts the section body. Keys are header names with bold markers removed,
+    lowercased; the first header with a given name wins. The mapping is shared
+    between callers through the cache, so it is read-only.
+    """
+    sections = {}
+    name, body = None, []
+    for line in text.splitlines():
+        header = _SECTION_HEADER_RE.match(line)
+        if header:
+            if name is not None:
+                sections.setdefault(name, "\n".join(body).strip())
+            title, _, inline = header.group(1).replace('*', '').partition(':')
+            name, body = title.strip().lower(), [inline]
+        elif name is not None:
+            body.append(line)
+    if name is not None:
+        sections.setdefault(name, "\n".join(body).strip())
+    return MappingProxyType(sections)
+
+
+def _find_section(text: str, section_name: str) -> str:
+    """
+    Body of the first section whose header starts with section_name (case-insensitive).
+
+    Prefix matching keeps headers such as "Areas for Improvement (priority order)"
+    reachable as "Areas for Improvement".
+    """
+    sections = _parse_sections(text)
+    key = section_name.lower()
+    if key in sections:
+        return sections[key]
+    return next((body for name, body in sections.items() if name.startswith(key)), "")
+
+
+# Council reviewers in council-agent order, and the feedback category each one covers
+REVIEWER_NAMES = (
+    "Dr. Sarah Chen (Methodology)",
+    "Prof. James Rodriguez (Comprehensiveness)",
+    "Dr. Emily Thompson (Clarity)"
+)
+REVIEWER_CATEGORIES = ("methodology", "comprehensiveness", "clarity")
+
+# Revision priority raised when a reviewer scores below 3
+PRIORITY_MESSAGES = {
+    "methodology": "CRITICAL: Address methodology issues",
+    "comprehensiveness": "CRITICAL: Expand topic coverage",
+    "clarity": "CRITICAL: Improve clarity and organization",
+}
+
+# Characters of each related prior report included in the research prompt
+PRIOR_REPORT_CHARS = 4000
+
+# The workflow is one research round plus at most one revision round
+MAX_ITERATIONS = 2
+
+# Static parts of the revision prompt; the per-round feedback is spliced in between
+_REVISION_HEADER = """
+REVISION REQUEST - Your research has been reviewed by the council and needs improvement.
+
+"""
+
+_REVISION_FEEDBACK_BLOCKS = (
+    ("METHODOLOGY FEEDBACK (Dr. Sarah Chen):", 'methodology_feedback'),
+    ("COMPREHENSIVENESS FEEDBACK (Prof. James Rodriguez):", 'comprehensiveness_feedback'),
+    ("CLARITY & COMMUNICATION FEEDBACK (Dr. Emily Thompson):", 'clarity_feedback'),
+)
+
+_REVISION_INSTRUCTIONS = """
+INSTRUCTIONS FOR REVISION:
+1. Address ALL critical priority items listed above
+2. Use additional research tools to gather more sources if needed
+3. Improve source quality by prioritizing authoritative sources (.edu, .gov, peer-reviewed)
+4. Expand coverage of gaps identified by the comprehensiveness reviewer
+5. Improve clarity, organization, and structure as noted by the clarity reviewer
+6. Maintain the strengths of your original research while addressing weaknesses
+
+Your revised research will be reviewed again by the same council. Aim to score 3.0 or higher with at least 2 reviewers.
+
+Conduct your revision now, using all available research tools as needed.
+"""
+
+
+_council_pool = None
+
+
+def _council_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide council pool, created on first use and shut down at exit."""
+    global _council_pool
+    if _council_pool is None:
+        # spawn, not fork: the app process has live threads (event loop, HTTP clients)
+        _council_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        atexit.register(_council_pool.shutdown, cancel_futures=True)
+    return _council_pool
+
+
+@lru_cache(maxsize=1)
+def _worker_council() -> List:
+    """Council agents of a worker process, built on its first review."""
+    from agents.council import create_council_agents
+    return create_council_agents()
+
+
+def _run_council_review(index: int, research_report: str) -> str:
+    """
+    Process pool worker: run council reviewer index on research_report.
+
+    The agents hold HTTP clients and locks and cannot be pickled, so each worker
+    rebuilds the council from config instead of receiving the parent's agents.
+    """
+    return _worker_council()[index].run(research_report)
+
+
+def _create_council_executor():
+    """
+    Process pool for council reviews when COUNCIL_EXECUTOR is "process".
+
+    Every orchestrator shares one pool. Returns None (asyncio's default thread
+    pool) otherwise.
+    """
+    if COUNCIL_EXECUTOR != "process":
+        return None
+    return _council_process_pool(len(REVIEWER_NAMES))
+
+
+def _create_eager_task(coro) -> asyncio.Task:
+    """
+    Create a task that starts eagerly (Python 3.12+), a regular task otherwise.
+
+    The first step of each council task then runs inline instead of waiting a
+    loop turn; cache hits complete without being scheduled at all. Only these
+    tasks are affected: the running loop's task factory is left untouched.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return asyncio.create_task(coro)
+    return eager_task_factory(asyncio.get_running_loop(), coro)
+
+
+class AcceptanceTracker:
+    """
+    Incremental council decision: accept once 2 reviewers score >= 3.0.
+
+    Fed one score at a time as reviews arrive, so the outcome is known as soon
+    as it is determined rather than after all reviews are in.
+    """
+
+    def __init__(self, total: int = 3, required: int = 2, threshold: float = 3.0):
+        """
+        Args:
+            total: Number of reviews expected
+            required: Passing reviews needed to accept
+            threshold: Minimum passing score
+        """
+        self.required = required
+        self.threshold = threshold
+        self.passing = 0
+        self.failing = 0
+        self.pending = total
+
+    def update(self, score: float):
+        """
+        Record one review score.
+
+        Returns:
+            True once accepted, False once acceptance is no longer reachable,
+            None while undecided
+        """
+        self.pending -= 1
+        if score >= self.threshold:
+            self.passing += 1
+        else:
+            self.failing += 1
+
+        if self.passing >= self.required:
+            return True
+        if self.passing + self.pending < self.required:
+            return False
+        return None
+
+
+async def collect_council_reviews(review_tasks: Dict[asyncio.Task, int], reviewer_names) -> tuple:
+    """
+    Await council review tasks as they complete, stopping once acceptance is decided.
+
+    Each task resolves to a review dict ('reviewer', 'review_text', 'score',
+    'recommendation'). Once 2 reviewers have passed the report the remaining
+    tasks are cancelled, and each is returned as a 'CANCELLED' placeholder with
+    a score of None. A decided rejection still waits for every review: the
+    revision needs all the feedback.
+
+    Args:
+        review_tasks: Review task -> index of its reviewer
+        reviewer_names: Reviewer display names, by index
+
+    Returns:
+        tuple: (reviews in reviewer order, True if accepted)
+    """
+    pending = set(review_tasks)
+    reviews = [None] * len(review_tasks)
+
+    tracker = AcceptanceTracker(len(review_tasks))
+    accepted = False
+    try:
+        while pending and not accepted:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                review = task.result()
+                reviews[review_tasks[task]] = review
+                if tracker.update(review['score']) is True:
+                    accepted = True
+    finally:
+        # Accepted early (or interrupted): stop waiting on the rest. The worker thread
+        # still finishes its in-flight LLM call, but nothing awaits the result.
+        for task in pending:
+            task.cancel()
+
+    for task in pending:
+        i = review_tasks[task]
+        reviews[i] = {
+            'reviewer': reviewer_names[i],
+            'review_text': 'Review not needed: 2 reviewers had already accepted the research.',
+            'score': None,
+            'recommendation': 'CANCELLED'
+        }
+    return reviews, accepted
 
 
 class ResearchOrchestrator:
@@ -34,7 +308,13 @@ class ResearchOrchestrator:
         """
         self.researcher = researcher_agent
         self.council = council_agents
-        self.max_iterations = 2  # Initial research + 1 revision max
+        # Worker processes rebuild the standard council (create_council_agents) themselves
+        self.council_executor = _create_council_executor()
+        # Initial research + 1 revision max; execute_research runs exactly these two rounds
+        self.max_iterations = MAX_ITERATIONS
+        # Report prefix hash -> {'accepted_count': int, 'scores': {reviewer index: last real score}}
+        # from consecutive real council rounds in which every review scored >= 3
+        self.trajectory_cache = {}
 
     async def execute_research(self, query: str) -> Dict:
         """
@@ -49,54 +329,72 @@ class ResearchOrchestrator:
                 'research_report': str (final research report),
                 'all_reviews': list (all review rounds),
                 'iterations': int (number of iterations completed),
-                'final_scores': list (final round scores)
+                'final_scores': list (final round scores),
+                'cache_stats': dict (process-wide LLM cache hits/misses),
+                'cached': bool (True if served from the accepted-result cache)
             }
         """
-        iteration = 0
-        research_report = None
-        all_reviews = []
-
-        while iteration < self.max_iterations:
-            # Phase 1: Research (or revision)
-            if iteration == 0:
-                # Initial research
-                research_report = await self._conduct_research(query)
-            else:
-                # Revision with feedback
-                feedback = self._synthesize_feedback(all_reviews[-1])
-                research_report = await self._revise_research(query, research_report, feedback)
-
-            # Phase 2: Council review (parallel)
-            reviews = await self._parallel_council_review(research_report)
-            scores = [review['score'] for review in reviews]
-            all_reviews.append({
-                'iteration': iteration + 1,
-                'reviews': reviews,
-                'scores': scores
-            })
-
-            # Phase 3: Decision (2+ with 3+ = accept, all <3 = retry)
-            accept = self._evaluate_acceptance(scores)
-
-            if accept or iteration == self.max_iterations - 1:
-                return {
-                    'status': 'accepted' if accept else 'completed_max_iterations',
-                    'research_report': research_report,
-                    'all_reviews': all_reviews,
-                    'iterations': iteration + 1,
-                    'final_scores': scores
-                }
-
-            iteration += 1
-
-        # Should not reach here, but return the last state
-        return {
-            'status': 'completed_max_iterations',
+        # A recently accepted result for the same query skips the whole pipeline
+        if TASK_CACHE_TTL_HOURS > 0:
+            cached = load_task_result(query, TASK_CACHE_TTL_HOURS)
+            if cached and cached.get('status') == 'accepted':
+                return {**cached, 'cache_stats': dict(llm_cache.stats), 'cached': True}
+
+        # Per-round scores and reviews kept side by side; the all_reviews
+        # dicts are only assembled for the returned result
+        score_history = []
+        review_history = []
+
+        # Round 1: initial research and council review
+        research_report = await self._conduct_research(query)
+        reviews = await self._parallel_council_review(research_report)
+        scores = [review['score'] for review in reviews]
+        review_history.append(reviews)
+        score_history.append(scores)
+
+        # Decision (2+ with 3+ = accept, all <3 = retry once)
+        if self._evaluate_acceptance(scores):
+            result = {
+                'status': 'accepted',
+                'research_report': research_report,
+                'all_reviews': self._assemble_reviews(review_history, score_history),
+                'iterations': 1,
+                'final_scores': scores
+            }
+            if TASK_CACHE_TTL_HOURS > 0:
+                save_task_result(query, result)
+            await self._index_accepted(query, research_report)
+            return {**result, 'cache_stats': dict(llm_cache.stats), 'cached': False}
+
+        # Round 2: revision with feedback, reviewed once more
+        feedback = self._synthesize_feedback({'reviews': reviews, 'scores': scores})
+        research_report = await self._revise_research(query, research_report, feedback)
+        reviews = await self._parallel_council_review(research_report)
+        scores = [review['score'] for review in reviews]
+        review_history.append(reviews)
+        score_history.append(scores)
+
+        accept = self._evaluate_acceptance(scores)
+        result = {
+            'status': 'accepted' if accept else 'completed_max_iterations',
             'research_report': research_report,
-            'all_reviews': all_reviews,
-            'iterations': iteration,
+            'all_reviews': self._assemble_reviews(review_history, score_history),
+            'iterations': 2,
             'final_scores': scores
         }
+        if accept:
+            if TASK_CACHE_TTL_HOURS > 0:
+                save_task_result(query, result)
+            await self._index_accepted(query, research_report)
+        return {**result, 'cache_stats': dict(llm_cache.stats), 'cached': False}
+
+    @staticmethod
+    def _assemble_reviews(review_history: List[List[Dict]], score_history: List[List[float]]) -> List[Dict]:
+        """Build the per-round all_reviews dicts from the parallel review and score lists."""
+        return [
+            {'iteration': i + 1, 'reviews': reviews, 'scores': scores}
+            for i, (reviews, scores) in enumerate(zip(review_history, score_history))
+        ]
 
     async def _conduct_research(self, query: str) -> str:
         """
@@ -109,11 +407,39 @@ class ResearchOrchestrator:
             str: Research report
         """
         try:
-            report = await asyncio.to_thread(self.researcher.run, query)
+            prompt = await self._research_prompt(query)
+            # Rephrasings of an earlier question may be served from the semantic cache,
+            # but only a bare query is safe to match that loosely
+            report = await cached_run(self.researcher, prompt, semantic=(prompt == query))
             return report
         except Exception as e:
             return f"Error conducting research: {str(e)}"
 
+    async def _research_prompt(self, query: str) -> str:
+        """
+        Build the initial research prompt, prefixed with related accepted reports.
+
+        Returns the query unchanged when RELATED_REPORTS is 0 or nothing similar
+        has been accepted before.
+        """
+        if RELATED_REPORTS <= 0:
+            return query
+        related = await asyncio.to_thread(report_index.search, query, RELATED_REPORTS)
+        if not related:
+            return query
+
+        parts = ["Prior accepted research on related queries. Reuse what is relevant and "
+                 "verify anything time-sensitive with your tools.\n"]
+        for prior in related:
+            parts.extend(("\n### ", prior['query'], "\n", prior['report'][:PRIOR_REPORT_CHARS], "\n"))
+        parts.extend(("\nResearch query: ", query))
+        return "".join(parts)
+
+    async def _index_accepted(self, query: str, research_report: str):
+        """Add an accepted report to the related-report index, if enabled."""
+        if RELATED_REPORTS > 0:
+            await asyncio.to_thread(report_index.add, query, research_report)
+
     async def _revise_research(self, query: str, original_report: str, feedback: Dict) -> str:
         """
         Execute research revision with council feedback.
@@ -129,7 +455,7 @@ class ResearchOrchestrator:
         revision_prompt = self._create_revision_prompt(query, original_report, feedback)
 
         try:
-            revised_report = await asyncio.to_thread(self.researcher.run, revision_prompt)
+            revised_report = await cached_run(self.researcher, revision_prompt)
             return revised_report
         except Exception as e:
             return f"Error revising research: {str(e)}"
@@ -138,53 +464,124 @@ class ResearchOrchestrator:
         """
         Execute parallel council reviews.
 
+        Reviews are collected as they complete. Once 2 reviewers have passed the
+        report, acceptance is decided and the remaining review is not awaited; it is
+        returned as a 'CANCELLED' placeholder with a score of None.
+
         Args:
             research_report (str): The research report to review
 
         Returns:
             list: List of review dictionaries with scores and feedback
         """
-        # Execute all 3 reviews in parallel
-        review_tasks = [
-            asyncio.to_thread(agent.run, research_report)
-            for agent in self.council
-        ]
+        # Reports whose opening has been accepted repeatedly skip the council
+        trajectory_key = hashlib.sha256(research_report[:2048].encode()).hexdigest()
+        history = self.trajectory_cache.get(trajectory_key)
+        if (COUNCIL_SKIP_AFTER_ACCEPTS > 0 and history
+                and history['accepted_count'] >= COUNCIL_SKIP_AFTER_ACCEPTS
+                and len(history['scores']) == len(self.council)):
+            return [
+                {
+                    'reviewer': REVIEWER_NAMES[i],
+                    'review_text': f"Review skipped: reports with this opening passed every review in {history['accepted_count']} consecutive rounds.",
+                    'score': history['scores'][i],
+                    'recommendation': 'PREDICTED'
+                }
+                for i in range(len(self.council))
+            ]
+
+        # Execute all 3 reviews in parallel; each reviewer has its own cache entries
+        review_tasks = {
+            _create_eager_task(self._run_review(i, research_report)): i
+            for i in range(len(self.council))
+        }
+        reviews, accepted = await collect_council_reviews(review_tasks, REVIEWER_NAMES)
 
+        self._record_trajectory(trajectory_key, reviews, accepted)
+        return reviews
+
+    async def _run_review(self, i: int, research_report: str) -> Dict:
+        """Run council reviewer i; a failure becomes an 'ERROR' review scored 0."""
         try:
-            review_texts = await asyncio.gather(*review_tasks)
-
-            # Parse reviews to extract scores and key information
-            reviews = []
-            reviewer_names = [
-                "Dr. Sarah Chen (Methodology)",
-                "Prof. James Rodriguez (Comprehensiveness)",
-                "Dr. Emily Thompson (Clarity)"
-            ]
+            review_text = await cached_run(
+                self.council[i], research_report, executor=self.council_executor,
+                run=partial(_run_council_review, i) if self.council_executor is not None else None
+            )
+        except Exception as e:
+            # Only the failed reviewer gets an error placeholder; the others still count
+            return {
+                'reviewer': REVIEWER_NAMES[i],
+                'review_text': f'Error: {str(e)}',
+                'score': 0.0,
+                'recommendation': 'ERROR'
+            }
 
-            for i, review_text in enumerate(review_texts):
-                score = self._extract_score(review_text)
-                recommendation = self._extract_recommendation(review_text)
+        score, recommendation = self._parse_review(review_text)
+        return {
+            'reviewer': REVIEWER_NAMES[i],
+            'review_text': review_text,
+            'score': score,
+            'recommendation': recommendation
+        }
 
-                reviews.append({
-                    'reviewer': reviewer_names[i],
-                    'review_text': review_text,
-                    'score': score,
-                    'recommendation': recommendation
-                })
+    def _record_trajectory(self, trajectory_key: str, reviews: List[Dict], accepted: bool):
+        """
+        Update the accept streak for a report prefix after a real council round.
 
-            return reviews
+        A round counts only when it was accepted and every completed review scored
+        >= 3; reviews cancelled after an early accept (score None) are skipped, and
+        the reviewer keeps its last real score. Any other round resets the streak,
+        so a prefix only skips the council while the council keeps agreeing with the
+        prediction. A reset streak is logged as prediction drift.
+        """
+        scores = {i: review['score'] for i, review in enumerate(reviews) if review['score'] is not None}
+        history = self.trajectory_cache.get(trajectory_key)
+        if not accepted or any(score < 3 for score in scores.values()):
+            if history is not None:
+                logger.warning(
+                    "Council disagreed with a %d-round accept streak: predicted %s, actual %s",
+                    history['accepted_count'], history['scores'], scores
+                )
+                del self.trajectory_cache[trajectory_key]
+            return
+        history = self.trajectory_cache.setdefault(trajectory_key, {'accepted_count': 0, 'scores': {}})
+        history['accepted_count'] += 1
+        history['scores'].update(scores)
+
+    def _parse_review(self, review_text: str) -> tuple:
+        """
+        Extract the overall score and recommendation from a review in one pass.
 
-        except Exception as e:
-            # Return default reviews on error
-            return [
-                {
-                    'reviewer': f'Reviewer {i+1}',
-                    'review_text': f'Error: {str(e)}',
-                    'score': 0.0,
-                    'recommendation': 'ERROR'
-                }
-                for i in range(3)
-            ]
+        Score precedence: "Overall Score: X / 5", then "Overall Score: X", then
+        "Score: X / 5" (first occurrence of each). An ACCEPT recommendation
+        anywhere takes precedence over REVISE.
+
+        Args:
+            review_text (str): The full review text
+
+        Returns:
+            tuple: (score capped at 5.0, 0.0 if not found;
+                    'ACCEPT', 'REVISE', or 'UNKNOWN')
+        """
+        score = None
+        score_rank = 3  # lower is better; 3 = no score yet
+        recommendation = 'UNKNOWN'
+
+        for match in _REVIEW_RE.finditer(review_text):
+            if match.group('recommendation'):
+                if recommendation != 'ACCEPT':
+                    recommendation = match.group('recommendation').upper()
+                if recommendation == 'ACCEPT' and score_rank == 0:
+                    break
+                continue
+
+            rank = _score_rank(match)
+            if rank is not None and rank < score_rank:
+                score, score_rank = float(match.group('score')), rank
+                if score_rank == 0 and recommendation == 'ACCEPT':
+                    break
+
+        return (min(score, 5.0) if score is not None else 0.0), recommendation  # Cap at 5.0
 
     def _extract_score(self, review_text: str) -> float:
         """
@@ -196,24 +593,17 @@ class ResearchOrchestrator:
         Returns:
             float: Overall score (0.0 if not found)
         """
-        # Look for "Overall Score: X.X / 5" or "Overall Score: X/5"
-        patterns = [
-            r'Overall Score:\s*(\d+\.?\d*)\s*/\s*5',
-            r'Overall Score:\s*(\d+\.?\d*)',
-            r'Score:\s*(\d+\.?\d*)\s*/\s*5'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, review_text, re.IGNORECASE)
-            if match:
-                try:
-                    score = float(match.group(1))
-                    return min(score, 5.0)  # Cap at 5.0
-                except ValueError:
-                    continue
-
-        # If no score found, return 0.0
-        return 0.0
+        # Same precedence as _parse_review, but stops at the first
+        # "Overall Score: X / 5" instead of scanning on for a recommendation
+        score = None
+        score_rank = 3
+        for match in _REVIEW_RE.finditer(review_text):
+            rank = _score_rank(match)
+            if rank is not None and rank < score_rank:
+                score, score_rank = float(match.group('score')), rank
+                if score_rank == 0:
+                    break
+        return min(score, 5.0) if score is not None else 0.0  # Cap at 5.0
 
     def _extract_recommendation(self, review_text: str) -> str:
         """
@@ -225,12 +615,7 @@ class ResearchOrchestrator:
         Returns:
             str: 'ACCEPT', 'REVISE', or 'UNKNOWN'
         """
-        if re.search(r'Recommendation:\s*ACCEPT', review_text, re.IGNORECASE):
-            return 'ACCEPT'
-        elif re.search(r'Recommendation:\s*REVISE', review_text, re.IGNORECASE):
-            return 'REVISE'
-        else:
-            return 'UNKNOWN'
+        return self._parse_review(review_text)[1]
 
     def _evaluate_acceptance(self, scores: List[float]) -> bool:
         """
@@ -241,13 +626,17 @@ class ResearchOrchestrator:
         - If all 3 reviewers scored < 3: REVISE (retry once)
 
         Args:
-            scores (list): List of 3 scores from council members
+            scores (list): List of 3 scores from council members (None for a skipped review)
 
         Returns:
             bool: True if accepted, False if revision needed
         """
-        passing_scores = sum(1 for score in scores if score >= 3.0)
-        return passing_scores >= 2
+        tracker = AcceptanceTracker(len(scores))
+        for score in scores:
+            # None marks a review skipped after an early accept
+            if score is not None and tracker.update(score) is not None:
+                break
+        return tracker.passing >= tracker.required
 
     def _synthesize_feedback(self, review_round: Dict) -> Dict:
         """
@@ -262,38 +651,25 @@ class ResearchOrchestrator:
         reviews = review_round['reviews']
         scores = review_round['scores']
 
-        # Collect all feedback points
-        methodology_feedback = []
-        comprehensiveness_feedback = []
-        clarity_feedback = []
+        # Collect all feedback points; reviews arrive in REVIEWER_CATEGORIES order
+        feedback_by_category = {category: [] for category in REVIEWER_CATEGORIES}
         priorities = []
 
-        for review in reviews:
-            reviewer_name = review['reviewer']
-            review_text = review['review_text']
+        for category, review in zip(REVIEWER_CATEGORIES, reviews):
             score = review['score']
 
             # Extract "Areas for Improvement" section
-            improvements = self._extract_section(review_text, "Areas for Improvement")
-
-            if "Methodology" in reviewer_name:
-                methodology_feedback.append(improvements)
-                if score < 3:
-                    priorities.append(f"CRITICAL: Address methodology issues")
-            elif "Comprehensiveness" in reviewer_name:
-                comprehensiveness_feedback.append(improvements)
-                if score < 3:
-                    priorities.append(f"CRITICAL: Expand topic coverage")
-            elif "Clarity" in reviewer_name:
-                clarity_feedback.append(improvements)
-                if score < 3:
-                    priorities.append(f"CRITICAL: Improve clarity and organization")
+            feedback_by_category[category].append(
+                _find_section(review['review_text'], "Areas for Improvement")
+            )
+
+            # A review cancelled after an early accept has no score
+            if score is not None and score < 3:
+                priorities.append(PRIORITY_MESSAGES[category])
 
         return {
             'scores': scores,
-            'methodology_feedback': methodology_feedback,
-            'comprehensiveness_feedback': comprehensiveness_feedback,
-            'clarity_feedback': clarity_feedback,
+            **{f'{category}_feedback': feedback for category, feedback in feedback_by_category.items()},
             'priorities': priorities
         }
 
@@ -308,11 +684,7 @@ class ResearchOrchestrator:
         Returns:
             str: Extracted section content
         """
-        pattern = rf'##?\s*{re.escape(section_name)}:?\s*(.*?)(?=##|\Z)'
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return ""
+        return _find_section(text, section_name)
 
     def _create_revision_prompt(self, query: str, original_report: str, feedback: Dict) -> str:
         """
@@ -326,44 +698,17 @@ class ResearchOrchestrator:
         Returns:
             str: Revision prompt for researcher
         """
-        priorities_text = "\n".join(f"- {p}" for p in feedback['priorities'])
-
-        methodology_text = "\n".join(feedback['methodology_feedback']) if feedback['methodology_feedback'] else "None"
-        comprehensiveness_text = "\n".join(feedback['comprehensiveness_feedback']) if feedback['comprehensiveness_feedback'] else "None"
-        clarity_text = "\n".join(feedback['clarity_feedback']) if feedback['clarity_feedback'] else "None"
-
-        revision_prompt = f"""
-REVISION REQUEST - Your research has been reviewed by the council and needs improvement.
-
-Original Research Query: {query}
-
-Council Review Scores: {feedback['scores']}
-
-TOP PRIORITIES FOR REVISION:
-{priorities_text}
-
-DETAILED FEEDBACK FROM COUNCIL:
-
-METHODOLOGY FEEDBACK (Dr. Sarah Chen):
-{methodology_text}
-
-COMPREHENSIVENESS FEEDBACK (Prof. James Rodriguez):
-{comprehensiveness_text}
-
-CLARITY & COMMUNICATION FEEDBACK (Dr. Emily Thompson):
-{clarity_text}
-
-INSTRUCTIONS FOR REVISION:
-1. Address ALL critical priority items listed above
-2. Use additional research tools to gather more sources if needed
-3. Improve source quality by prioritizing authoritative sources (.edu, .gov, peer-reviewed)
-4. Expand coverage of gaps identified by the comprehensiveness reviewer
-5. Improve clarity, organization, and structure as noted by the clarity reviewer
-6. Maintain the strengths of your original research while addressing weaknesses
-
-Your revised research will be reviewed again by the same council. Aim to score 3.0 or higher with at least 2 reviewers.
-
-Conduct your revision now, using all available research tools as needed.
-"""
-
-        return revision_prompt
+        parts = [
+            _REVISION_HEADER,
+            "Original Research Query: ", query, "\n\n",
+            "Council Review Scores: ", str(feedback['scores']), "\n\n",
+            "TOP PRIORITIES FOR REVISION:\n",
+        ]
+        parts.extend(f"- {p}\n" for p in feedback['priorities'])
+        if not feedback['priorities']:
+            parts.append("\n")
+        parts.append("\nDETAILED FEEDBACK FROM COUNCIL:\n")
+        for heading, key in _REVISION_FEEDBACK_BLOCKS:
+            parts.extend(("\n", heading, "\n", "\n".join(feedback[key]) if feedback[key] else "None", "\n"))
+        parts.append(_REVISION_INSTRUCTIONS)
+        return "".join(parts)
@@ -1,61 +1,197 @@
 """
 Research tools for the multi-agent research system.
 
-Provides 5 core tools:
+Provides 7 core tools:
 1. web_search - Search the web using DuckDuckGo
 2. scrape_webpage - Extract content from webpages
-3. analyze_document - Analyze PDFs and documents
-4. synthesize_data - Aggregate information from multiple sources
-5. track_citations - Extract and manage citations
+3. scrape_webpages - Extract content from several webpages concurrently
+4. analyze_document - Analyze PDFs and documents
+5. analyze_documents - Analyze several documents in parallel
+6. synthesize_data - Aggregate information from multiple sources
+7. track_citations - Extract and manage citations
 """
 
 import os
 import re
 import json
-import hashlib
+import asyncio
+import sqlite3
+import threading
 import time
-from datetime import datetime
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
+from urllib.parse import urlparse
 from smolagents import tool
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
 # Cache directory
 CACHE_DIR = os.getenv("CACHE_DIR", "data/research_cache")
 os.makedirs(CACHE_DIR, exist_ok=True)
 
-
-def _get_cache_path(key: str) -> str:
-    """Generate cache file path from key."""
-    hashed = hashlib.md5(key.encode()).hexdigest()
-    return os.path.join(CACHE_DIR, f"{hashed}.json")
+# Searches and scraped pages share one SQLite key-value table
+CACHE_DB = os.path.join(CACHE_DIR, "tools_cache.sqlite3")
+_cache_local = threading.local()
+
+# Recently used entries also stay in process memory: key -> (data, stored_at)
+MEMORY_CACHE_SIZE = 512
+_memory_cache = OrderedDict()
+_memory_lock = threading.Lock()
+
+# Scraping: browser-like headers, pages fetched at once by scrape_webpages,
+# and minimum seconds between requests to the same host
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+SCRAPE_CONCURRENCY = 10
+SCRAPE_HOST_INTERVAL = 1.0
+
+# Shared HTTP session: keep-alive connections are reused across scrapes of the same
+# host, and transient failures (connection errors, 429, 5xx) are retried with backoff
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Download caps: pages beyond SCRAPE_MAX_BYTES are truncated (only the first 10k
+# characters of text are kept anyway); documents beyond DOCUMENT_MAX_BYTES are rejected
+SCRAPE_MAX_BYTES = 1_000_000
+DOCUMENT_MAX_BYTES = 50_000_000
+
+# Documents analyzed at once by analyze_documents
+DOCUMENT_CONCURRENCY = 4
+
+# BeautifulSoup backend: libxml2 via lxml (a newspaper3k dependency) when available
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Text patterns used by analyze_document, synthesize_data and track_citations, compiled once.
+# The citation forms are alternatives of one pattern so a document is scanned once for all of them.
+_CITATION_RE = re.compile(
+    r'\([A-Z][a-z]+(?:,?\s+[A-Z][a-z]+)*,?\s+\d{4}\)'  # (Author, Year)
+    r'|\[[0-9]+\]'  # [1]
+    r'|[A-Z][a-z]+\s+et\s+al\.\s+\(\d{4}\)'  # Author et al. (Year)
+)
+_CITATION_COUNT_RE = re.compile(r'\([A-Z][a-z]+.*?\d{4}\)')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'\b[A-Za-z]{4,}\b')
+_STOPWORDS = frozenset({'that', 'this', 'with', 'from', 'have', 'been', 'were', 'their', 'which'})
+_TRACKED_CITATION_RE = re.compile(
+    r'\((?P<paren_author>[A-Z][a-z]+(?:\s+et\s+al\.)?),?\s+(?P<paren_year>\d{4})\)'  # (Author, Year)
+    r'|\[(?P<number>\d+)\]'  # [1]
+    r'|(?P<et_al_author>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+et\s+al\.\s+\((?P<et_al_year>\d{4})\)'  # Author et al. (Year)
+)
+# Source credibility tiers for track_citations: a URL containing any of the
+# domains gets the tier's score, checked highest tier first
+_HIGH_CREDIBILITY_RE = re.compile('|'.join(map(re.escape, ['.edu', '.gov', '.ac.uk'])))
+_MEDIUM_CREDIBILITY_RE = re.compile('|'.join(map(re.escape, ['.org', 'arxiv.org', 'doi.org'])))
+_LOW_CREDIBILITY_RE = re.compile('|'.join(map(re.escape, ['nytimes.com', 'bbc.com', 'nature.com', 'science.org'])))
+
+# Cache lifetimes. A search whose results come back unchanged on refetch has its
+# lifetime doubled, up to SEARCH_MAX_TTL_HOURS. An expired page is revalidated with
+# its ETag/Last-Modified and kept as-is if the server answers 304 Not Modified.
+SEARCH_TTL_HOURS = 24
+SEARCH_MAX_TTL_HOURS = 168
+SCRAPE_TTL_HOURS = 168  # 7 days
+VALIDATORS_TTL_HOURS = 24 * 90
+
+# PDFs with at least this many pages are extracted in parallel worker processes,
+# each taking at least PDF_PAGES_PER_WORKER pages (process startup is not free)
+PDF_PARALLEL_MIN_PAGES = 64
+PDF_PAGES_PER_WORKER = 32
+# PDFium is not thread-safe; analyze_documents reads PDFs from several threads,
+# so every in-process pypdfium2 call holds this lock
+_pdfium_lock = threading.Lock()
+
+# host -> monotonic time of its next free request slot
+_next_request_at = {}
+_host_lock = threading.Lock()
+
+
+def _cache_db() -> sqlite3.Connection:
+    """Open (once per thread) the tool cache database."""
+    conn = getattr(_cache_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(CACHE_DB, timeout=10)
+        # WAL lets the agent's worker threads read while another writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, stored_at REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        _cache_local.conn = conn
+    return conn
+
+
+def _remember(key: str, data, stored_at: float):
+    """Put an entry in the in-process LRU in front of the database."""
+    with _memory_lock:
+        _memory_cache[key] = (data, stored_at)
+        _memory_cache.move_to_end(key)
+        if len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _load_cache_entry(key: str) -> tuple:
+    """Load cached data with its age in hours, fresh or not; None if absent."""
+    with _memory_lock:
+        hit = _memory_cache.get(key)
+        if hit:
+            _memory_cache.move_to_end(key)
+    if hit is None:
+        try:
+            row = _cache_db().execute("SELECT stored_at, data FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            hit = (json.loads(row[1]), row[0])
+        except (sqlite3.Error, json.JSONDecodeError):
+            return None
+        _remember(key, *hit)
+    data, stored_at = hit
+    return data, (time.time() - stored_at) / 3600
 
 
 def _load_from_cache(key: str, max_age_hours: int = 24) -> dict:
     """Load data from cache if available and fresh."""
-    cache_path = _get_cache_path(key)
-    if os.path.exists(cache_path):
-        try:
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
-                cache_time = datetime.fromisoformat(cached.get('timestamp', ''))
-                age_hours = (datetime.now() - cache_time).total_seconds() / 3600
-                if age_hours < max_age_hours:
-                    return cached.get('data')
-        except (json.JSONDecodeError, ValueError):
-            pass
+    entry = _load_cache_entry(key)
+    if entry and entry[1] < max_age_hours:
+        return entry[0]
     return None
 
 
+def _touch_cache(key: str):
+    """Mark a cached entry as fresh again without rewriting its data."""
+    stored_at = time.time()
+    with _memory_lock:
+        if key in _memory_cache:
+            _memory_cache[key] = (_memory_cache[key][0], stored_at)
+    try:
+        with _cache_db() as conn:
+            conn.execute("UPDATE cache SET stored_at = ? WHERE key = ?", (stored_at, key))
+    except sqlite3.Error as e:
+        print(f"Cache update failed: {e}")
+
+
 def _save_to_cache(key: str, data: dict):
     """Save data to cache."""
-    cache_path = _get_cache_path(key)
+    stored_at = time.time()
+    _remember(key, data, stored_at)
     try:
-        with open(cache_path, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'data': data
-            }, f)
+        with _cache_db() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, stored_at, data) VALUES (?, ?, ?)",
+                (key, stored_at, json.dumps(data))
+            )
     except Exception as e:
         print(f"Cache save failed: {e}")
 
@@ -86,9 +222,10 @@ def web_search(query: str, max_results: int = 5) -> dict:
     try:
         # Check cache first
         cache_key = f"search_{query}_{max_results}"
-        cached = _load_from_cache(cache_key, max_age_hours=24)
-        if cached:
-            return cached
+        entry = _load_cache_entry(cache_key)
+        ttl = _load_from_cache(f"ttl_{cache_key}", max_age_hours=SEARCH_MAX_TTL_HOURS * 2) or SEARCH_TTL_HOURS
+        if entry and entry[0] and entry[1] < ttl:
+            return entry[0]
 
         # Import here to avoid dependency issues if not installed
         from duckduckgo_search import DDGS
@@ -110,7 +247,11 @@ def web_search(query: str, max_results: int = 5) -> dict:
             "total_results": len(results)
         }
 
-        # Cache the results
+        # Cache the results; stable results are trusted for longer next time
+        if entry and entry[0] and [r["url"] for r in entry[0]["results"]] == [r["url"] for r in results]:
+            _save_to_cache(f"ttl_{cache_key}", min(ttl * 2, SEARCH_MAX_TTL_HOURS))
+        elif ttl != SEARCH_TTL_HOURS:
+            _save_to_cache(f"ttl_{cache_key}", SEARCH_TTL_HOURS)
         _save_to_cache(cache_key, response)
 
         return response
@@ -124,6 +265,141 @@ def web_search(query: str, max_results: int = 5) -> dict:
         }
 
 
+def _host_delay(url: str) -> float:
+    """
+    Reserve the next request slot for url's host and return how long to wait for it.
+
+    Requests to the same host are spaced SCRAPE_HOST_INTERVAL seconds apart;
+    different hosts do not wait on each other.
+    """
+    host = urlparse(url).netloc
+    with _host_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_at.get(host, now))
+        _next_request_at[host] = slot + SCRAPE_HOST_INTERVAL
+    return slot - now
+
+
+def _page_text(html: bytes, soup) -> str:
+    """
+    All page text outside script, style and navigation elements.
+
+    Uses selectolax's Lexbor backend (C HTML parser) when installed; otherwise
+    strips the elements from soup in place.
+    """
+    try:
+        # Import here to avoid dependency issues if not installed
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        LexborHTMLParser = None
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(["script", "style", "nav", "footer", "aside"])
+        return tree.root.text() if tree.root else ""
+
+    # Remove script and style elements
+    for script in soup(["script", "style", "nav", "footer", "aside"]):
+        script.decompose()
+    return soup.get_text()
+
+
+def _parse_webpage(url: str, html: bytes, extract_links: bool) -> dict:
+    """Build the scrape_webpage result from a fetched page."""
+    # Parse with BeautifulSoup
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    # Extract title
+    title_tag = soup.find('title')
+    title = title_tag.get_text() if title_tag else "No title"
+
+    # Try to use newspaper3k for better extraction
+    try:
+        from newspaper import Article
+        article = Article(url)
+        article.set_html(html)
+        article.parse()
+        content = article.text
+        author = ', '.join(article.authors) if article.authors else None
+        publish_date = article.publish_date.isoformat() if article.publish_date else None
+    except:
+        # Fallback to basic extraction
+        content = _page_text(html, soup)
+        # Clean up whitespace
+        lines = (line.strip() for line in content.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        content = '\n'.join(chunk for chunk in chunks if chunk)
+
+        author = None
+        publish_date = None
+
+    # Extract links if requested
+    links = []
+    if extract_links:
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if href.startswith('http'):
+                links.append(href)
+                if len(links) == 20:  # only the first 20 are returned
+                    break
+
+    # Build response
+    return {
+        "url": url,
+        "title": title,
+        "content": content[:10000],  # Limit to first 10k chars
+        "metadata": {
+            "author": author,
+            "publish_date": publish_date,
+            "word_count": len(content.split())
+        },
+        "links": links[:20] if extract_links else []  # Limit to 20 links
+    }
+
+
+def _read_capped(response, limit: int) -> bytes:
+    """Read a streamed requests response body, stopping after limit bytes."""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) >= limit:
+            break
+    return bytes(body[:limit])
+
+
+def _scrape_error(url: str, error: Exception) -> dict:
+    return {
+        "error": str(error),
+        "url": url,
+        "title": "",
+        "content": "",
+        "metadata": {},
+        "links": []
+    }
+
+
+def _conditional_headers(url: str, cached) -> dict:
+    """Request headers for url, revalidating against the stored ETag/Last-Modified if there is a cached copy."""
+    headers = dict(SCRAPE_HEADERS)
+    validators = _load_from_cache(f"validators_{url}", max_age_hours=VALIDATORS_TTL_HOURS) if cached else None
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def _save_validators(url: str, response_headers):
+    """Remember a page's ETag/Last-Modified for later revalidation."""
+    validators = {
+        'etag': response_headers.get('ETag'),
+        'last_modified': response_headers.get('Last-Modified')
+    }
+    if validators['etag'] or validators['last_modified']:
+        _save_to_cache(f"validators_{url}", validators)
+
+
 @tool
 def scrape_webpage(url: str, extract_links: bool = False) -> dict:
     """
@@ -149,118 +425,222 @@ def scrape_webpage(url: str, extract_links: bool = False) -> dict:
     try:
         # Check cache
         cache_key = f"scrape_{url}"
-        cached = _load_from_cache(cache_key, max_age_hours=168)  # 7 days
-        if cached:
+        entry = _load_cache_entry(cache_key)
+        cached = entry[0] if entry else None
+        if cached and entry[1] < SCRAPE_TTL_HOURS:
             return cached
 
-        # Rate limiting
-        time.sleep(1)
-
-        # Fetch the page
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Rate limiting (per host)
+        time.sleep(_host_delay(url))
 
-        # Extract title
-        title = soup.find('title').get_text() if soup.find('title') else "No title"
+        # Fetch the page (conditionally, if an expired copy is cached)
+        with _SESSION.get(url, headers=_conditional_headers(url, cached), timeout=10, stream=True) as response:
+            if response.status_code == 304 and cached:
+                _touch_cache(cache_key)
+                return cached
+            response.raise_for_status()
+            html = _read_capped(response, SCRAPE_MAX_BYTES)
 
-        # Try to use newspaper3k for better extraction
-        try:
-            from newspaper import Article
-            article = Article(url)
-            article.set_html(response.content)
-            article.parse()
-            content = article.text
-            author = ', '.join(article.authors) if article.authors else None
-            publish_date = article.publish_date.isoformat() if article.publish_date else None
-        except:
-            # Fallback to basic extraction
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "aside"]):
-                script.decompose()
-
-            # Get text
-            content = soup.get_text()
-            # Clean up whitespace
-            lines = (line.strip() for line in content.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            content = '\n'.join(chunk for chunk in chunks if chunk)
-
-            author = None
-            publish_date = None
-
-        # Extract links if requested
-        links = []
-        if extract_links:
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.startswith('http'):
-                    links.append(href)
-
-        # Build response
-        result = {
-            "url": url,
-            "title": title,
-            "content": content[:10000],  # Limit to first 10k chars
-            "metadata": {
-                "author": author,
-                "publish_date": publish_date,
-                "word_count": len(content.split())
-            },
-            "links": links[:20] if extract_links else []  # Limit to 20 links
-        }
+        result = _parse_webpage(url, html, extract_links)
 
         # Cache the result
         _save_to_cache(cache_key, result)
+        _save_validators(url, response.headers)
 
         return result
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "url": url,
-            "title": "",
-            "content": "",
-            "metadata": {},
-            "links": []
-        }
+        return _scrape_error(url, e)
+
+
+async def _fetch_page(session, semaphore: asyncio.Semaphore, url: str, headers: dict) -> tuple:
+    """
+    Fetch one page, waiting for its host's rate-limit slot.
+
+    Returns:
+        tuple: (page bytes, response headers), or (None, None) on 304 Not Modified
+    """
+    await asyncio.sleep(_host_delay(url))
+    async with semaphore:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return None, None
+            response.raise_for_status()
+            # Stop reading at the size cap rather than buffering an arbitrarily large body
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                body += chunk
+                if len(body) >= SCRAPE_MAX_BYTES:
+                    break
+            return bytes(body[:SCRAPE_MAX_BYTES]), response.headers
+
+
+async def _fetch_pages(urls: List[str], headers: List[dict]) -> list:
+    """Fetch urls concurrently; each entry is _fetch_page's result or the exception raised."""
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY * 2)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(
+            *(_fetch_page(session, semaphore, url, url_headers) for url, url_headers in zip(urls, headers)),
+            return_exceptions=True
+        )
 
 
 @tool
-def analyze_document(file_path: str, analysis_type: str = "summary") -> dict:
+def scrape_webpages(urls: list, extract_links: bool = False) -> dict:
     """
-    Analyze documents (PDF, TXT, DOCX) for research purposes.
+    Scrape several webpages at once, fetching them concurrently.
+
+    Prefer this over repeated scrape_webpage calls when you have multiple URLs to read.
 
     Args:
-        file_path: Path to document file or URL to PDF
-        analysis_type: Type of analysis - "summary", "extract_citations",
-                       "key_points", "full_text"
+        urls: List of URLs to scrape
+        extract_links: Whether to extract links from each page
 
     Returns:
         dict: {
-            "file_path": str,
-            "document_type": str,
-            "analysis_type": str,
-            "content": str,
-            "metadata": {
-                "page_count": int or None,
-                "author": str or None,
-                "title": str or None,
-                "citations_found": int
-            }
+            "pages": [same structure as scrape_webpage, in the order of urls],
+            "total_pages": int
         }
     """
+    pages = [None] * len(urls)
+    to_fetch = []
+    stale = {}  # index -> expired cached copy, kept if the server says it is unchanged
+    for i, url in enumerate(urls):
+        entry = _load_cache_entry(f"scrape_{url}")
+        if entry and entry[0] and entry[1] < SCRAPE_TTL_HOURS:
+            pages[i] = entry[0]
+            continue
+        if entry and entry[0]:
+            stale[i] = entry[0]
+        to_fetch.append(i)
+
+    if to_fetch:
+        fetch_urls = [urls[i] for i in to_fetch]
+        headers = [_conditional_headers(urls[i], stale.get(i)) for i in to_fetch]
+        try:
+            fetched = asyncio.run(_fetch_pages(fetch_urls, headers))
+        except Exception as e:
+            fetched = [e] * len(to_fetch)
+
+        for i, outcome in zip(to_fetch, fetched):
+            url = urls[i]
+            if isinstance(outcome, BaseException):
+                pages[i] = _scrape_error(url, outcome)
+                continue
+            html, response_headers = outcome
+            if html is None and i in stale:
+                # 304 Not Modified
+                _touch_cache(f"scrape_{url}")
+                pages[i] = stale[i]
+                continue
+            try:
+                pages[i] = _parse_webpage(url, html or b"", extract_links)
+                _save_to_cache(f"scrape_{url}", pages[i])
+                _save_validators(url, response_headers or {})
+            except Exception as e:
+                pages[i] = _scrape_error(url, e)
+
+    return {
+        "pages": pages,
+        "total_pages": len(pages)
+    }
+
+
+def _pdfium_pages(pdf, start: int, stop: int) -> List[str]:
+    """Text of pages [start, stop) of an open pypdfium2 document."""
+    texts = []
+    for i in range(start, stop):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        texts.append(textpage.get_text_range())
+        textpage.close()
+        page.close()
+    return texts
+
+
+def _pdfium_page_range(args: tuple) -> List[str]:
+    """Process pool worker: open the PDF from bytes and extract one page range."""
+    import pypdfium2 as pdfium
+
+    content_bytes, start, stop = args
+    pdf = pdfium.PdfDocument(content_bytes)
+    try:
+        return _pdfium_pages(pdf, start, stop)
+    finally:
+        pdf.close()
+
+
+def _read_pdf(content_bytes: bytes) -> tuple:
+    """
+    Extract text and metadata from a PDF.
+
+    Uses pypdfium2 (native PDFium) when installed, PyPDF2 otherwise. With
+    pypdfium2, PDFs of PDF_PARALLEL_MIN_PAGES or more pages are split into
+    page ranges extracted in worker processes; smaller ones are read in-process
+    under _pdfium_lock.
+
+    Returns:
+        tuple: (full_text, page_count, author, title)
+    """
+    try:
+        # Import here to avoid dependency issues if not installed
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+
+    if pdfium is not None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(content_bytes)
+            try:
+                page_count = len(pdf)
+                metadata = pdf.get_metadata_dict()
+                workers = min(os.cpu_count() or 1, page_count // PDF_PAGES_PER_WORKER)
+                if page_count < PDF_PARALLEL_MIN_PAGES or workers < 2:
+                    pages = _pdfium_pages(pdf, 0, page_count)
+            finally:
+                pdf.close()
+
+        if page_count >= PDF_PARALLEL_MIN_PAGES and workers >= 2:
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+
+            chunk = -(-page_count // workers)  # ceiling division
+            ranges = [(content_bytes, i, min(i + chunk, page_count)) for i in range(0, page_count, chunk)]
+            # spawn, not fork: the agent process has live threads (event loop, HTTP clients)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                pages = [text for texts in pool.map(_pdfium_page_range, ranges) for text in texts]
+
+        return "\n".join(pages) + "\n", page_count, metadata.get('Author') or None, metadata.get('Title') or None
+
+    import PyPDF2
+    import io
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(content_bytes))
+
+    # Extract text from all pages
+    full_text = "\n".join(page.extract_text() for page in pdf_reader.pages) + "\n"
+
+    # Extract metadata
+    metadata = pdf_reader.metadata
+    author = metadata.get('/Author', None) if metadata else None
+    title = metadata.get('/Title', None) if metadata else None
+    return full_text, len(pdf_reader.pages), author, title
+
+
+def _analyze_document(file_path: str, analysis_type: str) -> dict:
+    """Body of analyze_document, shared with analyze_documents."""
     try:
         # Determine if it's a URL or file path
         if file_path.startswith('http'):
             # Download PDF from URL
-            response = requests.get(file_path, timeout=30)
-            content_bytes = response.content
+            with _SESSION.get(file_path, timeout=30, stream=True) as response:
+                content_bytes = _read_capped(response, DOCUMENT_MAX_BYTES + 1)
+            if len(content_bytes) > DOCUMENT_MAX_BYTES:
+                raise ValueError(f"Document larger than {DOCUMENT_MAX_BYTES // 1_000_000} MB")
             doc_type = "pdf"
         else:
             # Read local file
@@ -270,21 +650,7 @@ def analyze_document(file_path: str, analysis_type: str = "summary") -> dict:
 
         # Process based on document type
         if doc_type == 'pdf':
-            import PyPDF2
-            import io
-
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content_bytes))
-            page_count = len(pdf_reader.pages)
-
-            # Extract text from all pages
-            full_text = ""
-            for page in pdf_reader.pages:
-                full_text += page.extract_text() + "\n"
-
-            # Extract metadata
-            metadata = pdf_reader.metadata
-            author = metadata.get('/Author', None) if metadata else None
-            title = metadata.get('/Title', None) if metadata else None
+            full_text, page_count, author, title = _read_pdf(content_bytes)
 
         elif doc_type in ['txt', 'text']:
             full_text = content_bytes.decode('utf-8')
@@ -324,20 +690,13 @@ def analyze_document(file_path: str, analysis_type: str = "summary") -> dict:
                 content = full_text
         elif analysis_type == "extract_citations":
             # Extract text that looks like citations
-            citation_patterns = [
-                r'\([A-Z][a-z]+(?:,?\s+[A-Z][a-z]+)*,?\s+\d{4}\)',  # (Author, Year)
-                r'\[[0-9]+\]',  # [1]
-                r'[A-Z][a-z]+\s+et\s+al\.\s+\(\d{4}\)'  # Author et al. (Year)
-            ]
-            citations = []
-            for pattern in citation_patterns:
-                citations.extend(re.findall(pattern, full_text))
-            content = "\n".join(set(citations))  # Remove duplicates
+            citations = _CITATION_RE.findall(full_text)
+            content = "\n".join(dict.fromkeys(citations))  # Remove duplicates, keeping first-seen order
         elif analysis_type == "key_points":
             # Extract sentences that seem important (containing keywords)
             keywords = ['important', 'significant', 'concluded', 'found', 'demonstrated',
                        'results', 'showed', 'indicates', 'suggests']
-            sentences = re.split(r'[.!?]+', full_text)
+            sentences = _SENTENCE_SPLIT_RE.split(full_text)
             key_sentences = [s.strip() for s in sentences
                            if any(kw in s.lower() for kw in keywords)]
             content = "\n\n".join(key_sentences[:10])  # Top 10 key sentences
@@ -345,7 +704,7 @@ def analyze_document(file_path: str, analysis_type: str = "summary") -> dict:
             content = full_text[:2000]  # Default: first 2000 chars
 
         # Count citations
-        citation_count = len(re.findall(r'\([A-Z][a-z]+.*?\d{4}\)', full_text))
+        citation_count = len(_CITATION_COUNT_RE.findall(full_text))
 
         return {
             "file_path": file_path,
@@ -371,6 +730,90 @@ def analyze_document(file_path: str, analysis_type: str = "summary") -> dict:
         }
 
 
+@tool
+def analyze_document(file_path: str, analysis_type: str = "summary") -> dict:
+    """
+    Analyze documents (PDF, TXT, DOCX) for research purposes.
+
+    Args:
+        file_path: Path to document file or URL to PDF
+        analysis_type: Type of analysis - "summary", "extract_citations",
+                       "key_points", "full_text"
+
+    Returns:
+        dict: {
+            "file_path": str,
+            "document_type": str,
+            "analysis_type": str,
+            "content": str,
+            "metadata": {
+                "page_count": int or None,
+                "author": str or None,
+                "title": str or None,
+                "citations_found": int
+            }
+        }
+    """
+    return _analyze_document(file_path, analysis_type)
+
+
+@tool
+def analyze_documents(file_paths: list, analysis_type: str = "summary") -> dict:
+    """
+    Analyze several documents at once, downloading and parsing them in parallel.
+
+    Prefer this over repeated analyze_document calls when you have multiple documents.
+
+    Args:
+        file_paths: List of document file paths or PDF URLs
+        analysis_type: Type of analysis for every document - "summary",
+                       "extract_citations", "key_points", "full_text"
+
+    Returns:
+        dict: {
+            "documents": [same structure as analyze_document, in the order of file_paths],
+            "total_documents": int
+        }
+    """
+    if not file_paths:
+        return {"documents": [], "total_documents": 0}
+    with ThreadPoolExecutor(max_workers=min(len(file_paths), DOCUMENT_CONCURRENCY)) as pool:
+        documents = list(pool.map(lambda path: _analyze_document(path, analysis_type), file_paths))
+    return {
+        "documents": documents,
+        "total_documents": len(documents)
+    }
+
+
+def _tfidf_themes(documents: List[str], top_k: int):
+    """
+    Rank theme words across documents by summed TF-IDF weight.
+
+    Words common to every source are down-weighted, unlike a raw frequency count.
+
+    Returns:
+        list or None: Top words, or None if scikit-learn is not installed
+    """
+    try:
+        # Import here to avoid dependency issues if not installed
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        import numpy as np
+    except ImportError:
+        return None
+
+    vectorizer = TfidfVectorizer(stop_words='english', token_pattern=r'\b[a-z]{4,}\b', max_features=2048)
+    try:
+        matrix = vectorizer.fit_transform(documents)
+    except ValueError:
+        return []  # no words left after stop-word removal
+    scores = np.asarray(matrix.sum(axis=0)).ravel()
+    k = min(top_k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    words = vectorizer.get_feature_names_out()
+    return [str(words[i]) for i in top]
+
+
 @tool
 def synthesize_data(sources: list, synthesis_type: str = "comparison") -> dict:
     """
@@ -412,16 +855,15 @@ def synthesize_data(sources: list, synthesis_type: str = "comparison") -> dict:
 
         combined_text = " ".join(all_content)
 
-        # Simple keyword extraction for themes
-        words = re.findall(r'\b[a-z]{4,}\b', combined_text.lower())
-        word_freq = {}
-        for word in words:
-            if word not in ['that', 'this', 'with', 'from', 'have', 'been', 'were', 'their', 'which']:
-                word_freq[word] = word_freq.get(word, 0) + 1
-
         # Top themes
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        key_themes = [word for word, count in sorted_words[:5]]
+        key_themes = _tfidf_themes(all_content, 5)
+        if key_themes is None:
+            # Simple keyword extraction for themes
+            # Lowercase per matched word rather than copying the whole combined text first
+            word_freq = Counter(
+                word for word in map(str.lower, _WORD_RE.findall(combined_text)) if word not in _STOPWORDS
+            )
+            key_themes = [word for word, count in word_freq.most_common(5)]
 
         # Generate synthesis based on type
         if synthesis_type == "comparison":
@@ -499,52 +941,49 @@ def track_citations(content: str, source_url: str = None) -> dict:
         }
     """
     try:
-        citations = []
-
-        # Pattern 1: (Author, Year) or (Author et al., Year)
-        pattern1 = r'\(([A-Z][a-z]+(?:\s+et\s+al\.)?),?\s+(\d{4})\)'
-        matches1 = re.findall(pattern1, content)
-        for author, year in matches1:
-            citations.append({
-                "citation_text": f"({author}, {year})",
-                "type": "in-text",
-                "authors": [author.replace(' et al.', '')],
-                "year": int(year),
-                "source_url": source_url
-            })
-
-        # Pattern 2: [1], [2], etc.
-        pattern2 = r'\[(\d+)\]'
-        matches2 = re.findall(pattern2, content)
-        for num in matches2:
-            citations.append({
-                "citation_text": f"[{num}]",
-                "type": "numbered",
-                "authors": [],
-                "year": None,
-                "source_url": source_url
-            })
-
-        # Pattern 3: Author et al. (Year)
-        pattern3 = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+et\s+al\.\s+\((\d{4})\)'
-        matches3 = re.findall(pattern3, content)
-        for author, year in matches3:
-            citations.append({
-                "citation_text": f"{author} et al. ({year})",
-                "type": "in-text",
-                "authors": [author],
-                "year": int(year),
-                "source_url": source_url
-            })
+        # One scan; results keep the original grouping by citation form
+        author_year, numbered, et_al = [], [], []
+        for match in _TRACKED_CITATION_RE.finditer(content):
+            if match.group('paren_author'):
+                # Pattern 1: (Author, Year) or (Author et al., Year)
+                author, year = match.group('paren_author', 'paren_year')
+                author_year.append({
+                    "citation_text": f"({author}, {year})",
+                    "type": "in-text",
+                    "authors": [author.replace(' et al.', '')],
+                    "year": int(year),
+                    "source_url": source_url
+                })
+            elif match.group('number'):
+                # Pattern 2: [1], [2], etc.
+                num = match.group('number')
+                numbered.append({
+                    "citation_text": f"[{num}]",
+                    "type": "numbered",
+                    "authors": [],
+                    "year": None,
+                    "source_url": source_url
+                })
+            else:
+                # Pattern 3: Author et al. (Year)
+                author, year = match.group('et_al_author', 'et_al_year')
+                et_al.append({
+                    "citation_text": f"{author} et al. ({year})",
+                    "type": "in-text",
+                    "authors": [author],
+                    "year": int(year),
+                    "source_url": source_url
+                })
+        citations = author_year + numbered + et_al
 
         # Calculate source credibility based on domain
         credibility_score = 0.5  # Default
         if source_url:
-            if any(domain in source_url for domain in ['.edu', '.gov', '.ac.uk']):
+            if _HIGH_CREDIBILITY_RE.search(source_url):
                 credibility_score = 0.9
-            elif any(domain in source_url for domain in ['.org', 'arxiv.org', 'doi.org']):
+            elif _MEDIUM_CREDIBILITY_RE.search(source_url):
                 credibility_score = 0.8
-            elif any(domain in source_url for domain in ['nytimes.com', 'bbc.com', 'nature.com', 'science.org']):
+            elif _LOW_CREDIBILITY_RE.search(source_url):
                 credibility_score = 0.7
 
         return {
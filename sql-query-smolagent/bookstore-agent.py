@@ -1,6 +1,8 @@
 from smolagents import OpenAIServerModel, ToolCallingAgent, load_dotenv
 from tools import query_database, get_table_descriptions
 import os
+from collections import deque
+from cachetools import TTLCache
 
 load_dotenv()
 import streamlit as st
@@ -9,13 +11,28 @@ import streamlit as st
 
 from phoenix.otel import register
 
-# configure the Phoenix tracer
-tracer_provider = register(project_name="bookstore-agent", auto_instrument=True)
+# configure the Phoenix tracer (once per process; Streamlit reruns this script on every interaction)
+@st.cache_resource
+def init_tracer():
+    return register(project_name="bookstore-agent", auto_instrument=True)
+
+
+tracer_provider = init_tracer()
 
 # ----------------------------------------------------------------------------------------------------------
 
 
-# Initialize models
+# Most recent Q&A turns kept and re-rendered on each rerun
+CHAT_HISTORY_TURNS = 20
+
+# Answers to repeated questions are reused for a few minutes, so changes to the
+# database show up without a page reload
+RESPONSE_CACHE_SIZE = 64
+RESPONSE_CACHE_TTL_SECONDS = 300
+
+
+# Initialize models (one client per model, shared across reruns and sessions)
+@st.cache_resource
 def get_model(model_name: str):
     return OpenAIServerModel(
         model_id=model_name,
@@ -25,11 +42,12 @@ def get_model(model_name: str):
 
 
 # ----------------------------------------------------------------------------------------------------------
-# Get table descriptions for the prompt
-table_descriptions = get_table_descriptions()
-
-prompt_templates = {
-    "system_prompt": f"""
+# Prompt templates, built once per process (Streamlit reruns this script on every interaction)
+@st.cache_resource
+def get_prompt_templates():
+    table_descriptions = get_table_descriptions()
+    return {
+        "system_prompt": f"""
 You are an expert Python developer with deep knowledge of SQL and pandas. 
 
 The database has the following tables:
@@ -38,17 +56,19 @@ The database has the following tables:
 IMPORTANT:
 - Write SQL queries to extract data from the database
 - Use "query_database" tool to execute SQL queries on the database
-- Using the output dataframe from the tool call, please provide detailed answer to the user's query
+- The tool returns {{"columns": [...], "rows": [[...], ...], "truncated": ...}}; each row lists its values in column order
+- If "truncated" is true, the rows are only the first 1000 results: do not compute totals, counts or rankings from them; query again with the aggregation (SUM, COUNT, GROUP BY, ORDER BY ... LIMIT) done in SQL
+- Using the rows returned by the tool call, please provide detailed answer to the user's query
 - Where data can be formatted in a tabular format, please do so to make it easier for the user to read
 - All prices are in GBP (£)""",
-    "planning": {
-        "initial_plan": "",
-        "update_plan_pre_messages": "",
-        "update_plan_post_messages": "",
-    },
-    "managed_agent": {"task": "", "report": ""},
-    "final_answer": {"pre_messages": "", "post_messages": ""},
-}
+        "planning": {
+            "initial_plan": "",
+            "update_plan_pre_messages": "",
+            "update_plan_post_messages": "",
+        },
+        "managed_agent": {"task": "", "report": ""},
+        "final_answer": {"pre_messages": "", "post_messages": ""},
+    }
 
 
 # ----------------------------------------------------------------------------------------------------------
@@ -65,17 +85,22 @@ def main():
         index=0,
     )
 
-    # Initialize model and agent
-    model = get_model(model_name)
-    agent = ToolCallingAgent(
-        model=model,
-        tools=[query_database],
-        prompt_templates=prompt_templates,        
-    )
+    # Initialize model and agent. The agent keeps run state, so it is reused
+    # across reruns within a session rather than shared between sessions.
+    if st.session_state.get("agent_model") != model_name:
+        st.session_state.agent = ToolCallingAgent(
+            model=get_model(model_name),
+            tools=[query_database],
+            prompt_templates=get_prompt_templates(),
+        )
+        st.session_state.agent_model = model_name
+    agent = st.session_state.agent
 
     # Initialize chat history in session state if it doesn't exist
     if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
+        st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_TURNS)
+    if "response_cache" not in st.session_state:
+        st.session_state.response_cache = TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL_SECONDS)
 
     # Add example queries in the sidebar
     st.sidebar.header("Example Questions")
@@ -105,7 +130,12 @@ def main():
         try:
             with st.chat_message("assistant"):
                 with st.spinner("Analyzing data..."):
-                    output = agent.run(query)
+                    # Repeat questions in a session reuse a recent answer
+                    cache_key = (model_name, " ".join(query.lower().split()))
+                    output = st.session_state.response_cache.get(cache_key)
+                    if output is None:
+                        output = agent.run(query)
+                        st.session_state.response_cache[cache_key] = output
                     st.write(output)
                     # Add the Q&A pair to chat history
                     st.session_state.chat_history.append((query, output))
@@ -1,59 +1,107 @@
 from smolagents import tool
 import os
+import threading
+from decimal import Decimal
+from functools import lru_cache
 from sqlalchemy import create_engine, text, inspect
-import pandas as pd
+from sqlalchemy.pool import NullPool
 
 #----------------------------------------------------------------------------------------------------------
 
+# One engine per process, so tool calls reuse open connections
+# (or PgBouncer's, when PG_USE_PGBOUNCER is set)
+_ENGINE = None
+_ENGINE_LOCK = threading.Lock()
+
+
 def get_db_engine():
-    """Create and return a new database engine instance"""
-    pg_params = {
-        'database': os.getenv('PG_DATABASE'),
-        'user': os.getenv('PG_USER'),
-        'password': os.getenv('PG_PASSWORD'),
-        'host': os.getenv('PG_HOST'),
-        'port': os.getenv('PG_PORT')
-    }
-    return create_engine(
-        f"postgresql://{pg_params['user']}:{pg_params['password']}@{pg_params['host']}:{pg_params['port']}/{pg_params['database']}"
-    )
+    """Return the shared database engine, creating it on first use"""
+    global _ENGINE
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                pg_params = {
+                    'database': os.getenv('PG_DATABASE'),
+                    'user': os.getenv('PG_USER'),
+                    'password': os.getenv('PG_PASSWORD'),
+                    'host': os.getenv('PG_HOST'),
+                    'port': os.getenv('PG_PORT')
+                }
+                url = f"postgresql://{pg_params['user']}:{pg_params['password']}@{pg_params['host']}:{pg_params['port']}/{pg_params['database']}"
+                if os.getenv('PG_USE_PGBOUNCER', '').lower() in ('1', 'true', 'yes'):
+                    # PG_HOST/PG_PORT point at PgBouncer, which pools across all app processes
+                    _ENGINE = create_engine(url, poolclass=NullPool)
+                else:
+                    _ENGINE = create_engine(
+                        url,
+                        pool_size=5,
+                        max_overflow=10,
+                        pool_pre_ping=True,  # drop connections the server has closed
+                        pool_recycle=1800,  # replace connections before server or proxy idle timeouts
+                        pool_use_lifo=True,  # reuse the warmest connection; idle ones can time out
+                    )
+    return _ENGINE
 
 #----------------------------------------------------------------------------------------------------------
 
+# Tables described to the agent, in prompt order
+TABLES = ('inventory', 'sales', 'expenses')
+
+
+@lru_cache(maxsize=1)
 def get_table_descriptions():
-    """Get table descriptions for the prompt"""
-    engine = get_db_engine()
-    inspector = inspect(engine)
+    """Get table descriptions for the prompt (read from the database once per process)"""
+    # One reflection pass for all tables, keyed by (schema, table); None is the default schema
+    inspector = inspect(get_db_engine())
+    columns_by_table = inspector.get_multi_columns(filter_names=list(TABLES))
     table_descriptions = []
-    for table_name in ['inventory', 'sales', 'expenses']:
-        columns_info = [(col['name'], col['type']) for col in inspector.get_columns(table_name)]
+    for table_name in TABLES:
+        columns_info = [(col['name'], col['type']) for col in columns_by_table.get((None, table_name), [])]
         table_descriptions.append(f"{table_name} table:\n" + "\n".join(f"  - {col[0]}: {col[1]}" for col in columns_info))
-    engine.dispose()
     return table_descriptions
 
 #----------------------------------------------------------------------------------------------------------
 
+# Most rows query_database hands to the agent; more would not fit usefully in its context
+QUERY_MAX_ROWS = 1000
+
+
 @tool
-def query_database(query: str) -> pd.DataFrame:
+def query_database(query: str) -> dict:
     """
-    Execute a SQL query on the database and return the results as a pandas DataFrame.
+    Execute a SQL query on the database and return the result as column names and row values.
     
     Args:
-        query: SQL query to execute using pd.read_sql. The code should create a pandas DataFrame with the results.
+        query: SQL query to execute. The result has a "columns" list of column names and a "rows" list,
+            each row a list of values in column order.
+            At most 1000 rows are returned, so aggregate or filter in SQL rather than fetching whole tables.
+            When the result had more rows, "truncated" is True and totals, counts or rankings computed from
+            the rows would be wrong: run the query again with the aggregation or a LIMIT in SQL.
              
     Returns:
-        pd.DataFrame: Results of the query as a pandas DataFrame
+        dict: {"columns": [column names], "rows": [[values], ...], "truncated": bool} (first 1000 rows;
+            truncated is True when there were more)
     
     Example:
         query = "SELECT * FROM sales WHERE date >= current_date - interval '1 month'"
-        df = query_database(query)
-        return df
+        result = query_database(query)
+        return result
     """
     try:
-        engine = get_db_engine()
-        result_df = pd.read_sql(text(query), engine)
-        engine.dispose()
-        return result_df.to_dict(orient='records')
+        # Server-side cursor, so a huge result is never loaded past the rows kept
+        with get_db_engine().connect().execution_options(stream_results=True, max_row_buffer=QUERY_MAX_ROWS + 1) as conn:
+            result = conn.execute(text(query))
+            columns = list(result.keys())
+            # One row past the limit tells a cut-off result apart from one of exactly QUERY_MAX_ROWS
+            rows = result.fetchmany(QUERY_MAX_ROWS + 1)
+        truncated = len(rows) > QUERY_MAX_ROWS
+        # Column names once rather than repeated in every row keeps the agent's context small.
+        # NUMERIC columns come back as Decimal; return them as plain floats.
+        return {
+            "columns": columns,
+            "rows": [[float(value) if isinstance(value, Decimal) else value for value in row] for row in rows[:QUERY_MAX_ROWS]],
+            "truncated": truncated,
+        }
     except Exception as e:
         raise Exception(f"Error executing code: {str(e)}")
     
@@ -1,6 +1,133 @@
 from smolagents import tool
 import json
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
 import pandas as pd
+import requests
+import yfinance as yf
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+#----------------------------------------------------------------------------------
+
+# Most symbols looked up concurrently for one multi-ticker tool call
+MAX_SYMBOL_WORKERS = 8
+
+# Most Yahoo requests in flight at once across all tools and symbols. The agent
+# runs its tools in parallel and each fans out per symbol and section, which
+# could otherwise open dozens of connections and get rate limited.
+MAX_CONCURRENT_REQUESTS = 8
+_yahoo_requests = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# One keep-alive session for all Yahoo requests, pooling as many connections
+# as can be in flight. Transient failures and rate limiting are retried with
+# backoff; the last response is still handed to yfinance if retries run out.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False),
+))
+
+# How long results are reused across tool calls and chat turns. Company profiles
+# and financial statements change at most daily; news and the Ticker objects
+# behind it (which memoize their downloads) are kept briefly.
+DAILY_TTL_SECONDS = 24 * 3600
+NEWS_TTL_SECONDS = 300
+cache_stats = {"hits": 0, "misses": 0}
+_cache_lock = threading.Lock()
+
+
+def ttl_cached(ttl_seconds: int):
+    """
+    Cache the decorated fetch's result per arguments for ttl_seconds (error results are not cached).
+
+    Concurrent calls with the same arguments share one fetch, so a tool call
+    arriving while a prefetch is still running waits for it instead of repeating it.
+    """
+    def decorator(fetch):
+        cache = TTLCache(maxsize=256, ttl=ttl_seconds)
+        in_flight = {}  # args -> Future of the fetch running for them
+
+        @wraps(fetch)
+        def wrapper(*args):
+            with _cache_lock:
+                if args in cache:
+                    cache_stats["hits"] += 1
+                    return cache[args]
+                future = in_flight.get(args)
+                if future is None:
+                    cache_stats["misses"] += 1
+                    future = in_flight[args] = Future()
+                    owner = True
+                else:
+                    owner = False
+            if not owner:
+                return future.result()
+            try:
+                result = fetch(*args)
+            except BaseException as e:
+                with _cache_lock:
+                    del in_flight[args]
+                future.set_exception(e)
+                raise
+            with _cache_lock:
+                del in_flight[args]
+                if not (isinstance(result, dict) and "error" in result):
+                    cache[args] = result
+            future.set_result(result)
+            return result
+        return wrapper
+    return decorator
+
+
+@ttl_cached(NEWS_TTL_SECONDS)
+def ticker(stock: str) -> yf.Ticker:
+    """
+    Shared yfinance Ticker for stock. A Ticker memoizes what it has downloaded,
+    so tools asking about the same symbol within the cache lifetime reuse it.
+    """
+    return yf.Ticker(stock, session=_SESSION)
+
+
+# Well-formed Yahoo symbols, e.g. AAPL, BRK-B, VOD.L, ^GSPC, EURUSD=X
+SYMBOL_RE = re.compile(r"[A-Za-z0-9^][A-Za-z0-9.\-=^]{0,14}")
+
+# Symbols Yahoo has no quote for, so a hallucinated or mistyped ticker fails
+# without another round-trip for the rest of the day
+_unknown_symbols = TTLCache(maxsize=1024, ttl=DAILY_TTL_SECONDS)
+
+
+def unknown_symbol(symbol: str) -> bool:
+    """Whether symbol is malformed or already known not to exist on Yahoo."""
+    if not SYMBOL_RE.fullmatch(symbol):
+        return True
+    with _cache_lock:
+        return symbol.upper() in _unknown_symbols
+
+
+def for_each_symbol(fetch, stock: str):
+    """
+    Run fetch for every symbol in a comma/space separated stock string.
+
+    A single symbol returns fetch's result unchanged; several return a dict of
+    results keyed by symbol, fetched concurrently. Unknown symbols get an error
+    result without calling fetch.
+    """
+    def checked_fetch(symbol):
+        if unknown_symbol(symbol):
+            return {"error": f"Unknown ticker symbol: {symbol}", "stock": symbol}
+        return fetch(symbol)
+
+    symbols = [symbol for symbol in re.split(r'[\s,]+', stock) if symbol]
+    if len(symbols) <= 1:
+        return checked_fetch(symbols[0] if symbols else stock)
+    symbols = list(dict.fromkeys(symbols))
+    with ThreadPoolExecutor(max_workers=min(len(symbols), MAX_SYMBOL_WORKERS)) as executor:
+        return dict(zip(symbols, executor.map(checked_fetch, symbols)))
 
 #----------------------------------------------------------------------------------
 @tool
@@ -11,22 +138,33 @@ def get_company_info(stock: str) -> dict[str, dict]:
     Args:
         stock: The stock symbol/ticker to look up (e.g., 'AAPL' for Apple Inc.)
             Must be a valid stock symbol on supported exchanges.
+            Several symbols can be passed at once, separated by commas (e.g., 'MSFT,GOOGL').
 
     Returns:
         dict: Dictionary containing:
             - business_summary (str): Company's long business description
             - company_officers (list): List of company officers/executives with their details
+            For several symbols, a dictionary of the above keyed by symbol.
 
     Raises:
         ValueError: If the stock symbol is invalid or data cannot be retrieved
     """
-    import yfinance as yf
-    
-    data = yf.Ticker(stock)
+    return for_each_symbol(_company_info, stock)
+
+
+@ttl_cached(DAILY_TTL_SECONDS)
+def _company_info(stock: str) -> dict:
+    with _yahoo_requests:
+        info = ticker(stock).info
+    if "quoteType" not in info:
+        # yfinance returns an (almost) empty info dict for symbols Yahoo does not know
+        with _cache_lock:
+            _unknown_symbols[stock.upper()] = True
+        return {"error": f"Unknown ticker symbol: {stock}", "stock": stock}
     
     data_dict = {
-        "business_summary": data.info["longBusinessSummary"],
-        "company_officers": data.info["companyOfficers"]
+        "business_summary": info["longBusinessSummary"],
+        "company_officers": info["companyOfficers"]
     }
     
     return data_dict
@@ -35,7 +173,13 @@ def get_company_info(stock: str) -> dict[str, dict]:
 
 def convert_timestamps_to_strings(obj):
     """Recursively convert pandas Timestamps to strings in nested data structures."""
-    if isinstance(obj, pd.Timestamp):
+    # Plain numbers and strings are most of the nodes (statement values), so
+    # settle them before the slower pandas checks; x != x only for NaN
+    if isinstance(obj, float):
+        return None if obj != obj else obj
+    elif isinstance(obj, (str, int)):
+        return obj
+    elif isinstance(obj, pd.Timestamp):
         return obj.strftime('%Y-%m-%d')
     elif isinstance(obj, dict):
         return {str(k) if isinstance(k, pd.Timestamp) else k: convert_timestamps_to_strings(v) for k, v in obj.items()}
@@ -49,8 +193,18 @@ def convert_timestamps_to_strings(obj):
     else:
         return obj
 
+# Financial statement sections: name -> (Ticker method, keyword arguments)
+FINANCIAL_SECTIONS = {
+    "income_statement": ("get_income_stmt", {"as_dict": True, "pretty": True}),
+    "balance_sheet": ("get_balance_sheet", {"as_dict": True, "pretty": True}),
+    "cash_flow": ("get_cashflow", {"as_dict": True, "pretty": True}),
+    "analyst_price_target": ("get_analyst_price_targets", {}),
+    "earnings_estimate": ("get_earnings_estimate", {"as_dict": True}),
+}
+
+
 @tool
-def get_company_financials(stock: str) -> dict[str, dict]:
+def get_company_financials(stock: str, sections: str = None) -> dict[str, dict]:
     """
     This function retrieves various financial information including income statement,
     balance sheet, cash flow statement, analyst price targets, earnings estimates
@@ -59,27 +213,38 @@ def get_company_financials(stock: str) -> dict[str, dict]:
     Args:
         stock: The stock symbol/ticker to look up (e.g., 'AAPL' for Apple Inc.)
             Must be a valid stock symbol on supported exchanges.
+            Several symbols can be passed at once, separated by commas (e.g., 'MSFT,GOOGL').
+        sections: Optional comma-separated subset of income_statement, balance_sheet, cash_flow,
+            analyst_price_target, earnings_estimate to fetch only what is needed (default: all)
     
     Returns:
         dict: Dictionary containing:
             - Year: Dictionary of Company's income statement
+            For several symbols, a dictionary of the above keyed by symbol.
     """
-    import yfinance as yf
-    
+    selected = [section for section in re.split(r'[\s,]+', sections or "") if section] or list(FINANCIAL_SECTIONS)
+    unknown = [section for section in selected if section not in FINANCIAL_SECTIONS]
+    if unknown:
+        return {"error": f"Unknown sections: {', '.join(unknown)}. Choose from: {', '.join(FINANCIAL_SECTIONS)}", "stock": stock}
+    selected = [section for section in FINANCIAL_SECTIONS if section in selected]
+    return for_each_symbol(lambda symbol: _company_financials(symbol, selected), stock)
+
+
+@ttl_cached(DAILY_TTL_SECONDS)
+def _financial_section(stock: str, section: str):
+    method, kwargs = FINANCIAL_SECTIONS[section]
+    with _yahoo_requests:
+        raw = getattr(ticker(stock), method)(**kwargs)
+    # Convert all timestamps to strings to make it JSON serializable
+    return convert_timestamps_to_strings(raw)
+
+
+def _company_financials(stock: str, sections: list) -> dict:
     try:
-        data = yf.Ticker(stock)
-        
-        # Get raw data
-        raw_data = {
-            "income_statement": data.get_income_stmt(as_dict=True, pretty=True),
-            "balance_sheet": data.get_balance_sheet(as_dict=True, pretty=True),
-            "cash_flow": data.get_cashflow(as_dict=True, pretty=True),
-            "analyst_price_target": data.get_analyst_price_targets(),
-            "earnings_estimate": data.get_earnings_estimate(as_dict=True),
-        }
-        
-        # Convert all timestamps to strings to make it JSON serializable
-        data_dict = convert_timestamps_to_strings(raw_data)
+        # Each section is a separate request to Yahoo, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {section: executor.submit(_financial_section, stock, section) for section in sections}
+            data_dict = {section: future.result() for section, future in futures.items()}
         
         # Test if the data is JSON serializable
         try:
@@ -103,20 +268,75 @@ def get_company_news(stock: str) -> dict[dict]:
     
     Args:
         stock: The stock symbol (e.g. 'AAPL' for Apple Inc.)
+            Several symbols can be passed at once, separated by commas (e.g. 'MSFT,GOOGL').
     Returns:
         dict[dict]:
-            - latest_news: Most recent news article about the company
+            - latest_news: Most recent news articles about the company (title, publisher, link, published, summary)
+            For several symbols, a dictionary of the above keyed by symbol.
     Example:
         >>> data = get_company_news('AAPL')
         >>> print(data['latest_news'])
 
     """
-    import yfinance as yf
-    
-    data = yf.Ticker(stock)
+    return for_each_symbol(_company_news, stock)
+
+
+# Most articles returned per symbol
+NEWS_ARTICLES = 5
+
+
+def news_item(article: dict) -> dict:
+    """
+    The fields of a yfinance news article the agent uses, dropping thumbnails,
+    tracking ids and other metadata. Handles both Yahoo's current layout (fields
+    under "content") and the older flat one.
+    """
+    content = article.get("content", article)
+    return {
+        "title": content.get("title"),
+        "publisher": (content.get("provider") or {}).get("displayName") or content.get("publisher"),
+        "link": (content.get("canonicalUrl") or {}).get("url") or content.get("link"),
+        "published": content.get("pubDate") or content.get("providerPublishTime"),
+        "summary": content.get("summary"),
+    }
+
+
+@ttl_cached(NEWS_TTL_SECONDS)
+def _company_news(stock: str) -> dict:
+    data = ticker(stock)
     
-    data_dict = {"latest_news":data.get_news()}
+    with _yahoo_requests:
+        articles = data.get_news()
+
+    data_dict = {"latest_news": [news_item(article) for article in articles[:NEWS_ARTICLES]]}
 
     return data_dict
 
-#----------------------------------------------------------------------------------
\ No newline at end of file
+#----------------------------------------------------------------------------------
+
+# Background fetches started before the agent asks for them
+_prefetch_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+
+
+def prefetch(symbols: list):
+    """
+    Start fetching company info, every financial section and news for symbols
+    in the background. The tools then find the results cached, or wait on the
+    fetch already in flight, instead of requesting them one tool call at a time.
+    Failures are not cached, so a later tool call fetches again and reports them.
+    """
+    for symbol in symbols:
+        if not unknown_symbol(symbol):
+            _prefetch_executor.submit(_prefetch_symbol, symbol)
+
+
+def _prefetch_symbol(symbol: str):
+    # Company info first: it tells whether the symbol exists, so a word in the
+    # question that only looked like a ticker costs one request, not seven
+    if "error" in _company_info(symbol):
+        return
+    for section in FINANCIAL_SECTIONS:
+        _prefetch_executor.submit(_financial_section, symbol, section)
+    _prefetch_executor.submit(_company_news, symbol)
+
+#----------------------------------------------------------------------------------
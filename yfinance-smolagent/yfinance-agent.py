@@ -1,6 +1,10 @@
 from smolagents import OpenAIServerModel, ToolCallingAgent, load_dotenv
-from tools import get_company_info, get_company_financials, get_company_news
+from smolagents.memory import ActionStep
+from tools import get_company_info, get_company_financials, get_company_news, prefetch, NEWS_TTL_SECONDS
 import os
+import re
+from collections import deque
+from cachetools import TTLCache
 
 load_dotenv()
 import streamlit as st
@@ -9,13 +13,28 @@ import streamlit as st
 
 from phoenix.otel import register
 
-# configure the Phoenix tracer
-tracer_provider = register(project_name="yfinance-agent", auto_instrument=True)
+# configure the Phoenix tracer (once per process; Streamlit reruns this script on every interaction)
+@st.cache_resource
+def init_tracer():
+    return register(project_name="yfinance-agent", auto_instrument=True)
+
+
+tracer_provider = init_tracer()
 
 # ----------------------------------------------------------------------------------
 
 
-# Initialize models
+# Most recent Q&A turns kept and re-rendered on each rerun
+CHAT_HISTORY_TURNS = 20
+
+# Answers to repeated questions are reused for as long as the freshest tool data
+# (news) is, so a cached answer is never staler than a fresh one could be
+RESPONSE_CACHE_SIZE = 64
+RESPONSE_CACHE_TTL_SECONDS = NEWS_TTL_SECONDS
+
+
+# Initialize models (one client per model, shared across reruns and sessions)
+@st.cache_resource
 def get_model(model_name: str):
     return OpenAIServerModel(
         model_id=model_name,
@@ -24,89 +43,62 @@ def get_model(model_name: str):
     )
 
 
-# ----------------------------------------------------------------------------------
+# Upper-case words in a question that look like ticker symbols, and common ones that are not
+TICKER_RE = re.compile(r"\b[A-Z]{1,5}\b")
+NOT_TICKERS = frozenset({
+    "A", "I", "AND", "OR", "THE", "FOR", "VS", "CEO", "CFO", "CTO", "PE", "EPS", "EBIT",
+    "ROE", "ROI", "USD", "GBP", "EUR", "ETF", "IPO", "US", "UK", "EU", "YOY", "QOQ", "TTM",
+})
+# Most symbols prefetched for one question
+MAX_PREFETCH_SYMBOLS = 3
 
-prompt_templates = {
-    "system_prompt": """
 
-You are a senior financial analyst specializing in discrete asset management.
+def prefetch_tickers(query: str):
+    """Start downloading data for ticker symbols named in query while the model plans its tool calls."""
+    symbols = [symbol for symbol in dict.fromkeys(TICKER_RE.findall(query)) if symbol not in NOT_TICKERS]
+    prefetch(symbols[:MAX_PREFETCH_SYMBOLS])
 
-You have access to three key tools: Use all three tools to provide comprehensive financial analysis and insights. 
-But please try not to use the same tool more than once.
 
-get_company_info - Retrieve comprehensive company profiles
-get_company_financials - Obtain detailed financial statements and metrics
-get_company_news - Access real-time news and earnings reports
+def run_with_progress(agent, query: str):
+    """Run the agent, listing the tools each step called as it completes, and return the final answer."""
+    final = None
+    with st.status("Sourcing data and generating report...") as status:
+        for final in agent.run(query, stream=True):
+            if isinstance(final, ActionStep) and final.tool_calls:
+                status.write(f"Step {final.step_number}: " + ", ".join(call.name for call in final.tool_calls))
+        status.update(label="Report ready", state="complete")
+    # The last streamed item is the final answer (wrapped in a step with .output on newer smolagents)
+    return getattr(final, "output", final)
 
-Your responsibilities include:
-- Conducting in-depth financial analysis of stock symbols
-- Comparing companies across key metrics (market cap, P/E ratio, debt/equity)
-- Analyzing news impact on stock performance
-- Providing investment-grade insights for asset allocation decisions
 
-Analysis requirements:
-Always include quantitative data in markdown tables
-Use bold headers for key financial metrics
-Highlight material news events with timestamped annotations
-Compare at least 3 major financial metrics across companies
-Include risk assessment based on financial health indicators
-Response format:
+# ----------------------------------------------------------------------------------
 
-## Executive Summary
-[Company Name] is a leading player in the [industry sector]. Our analysis reveals:
-- [Key financial insight 1]
-- [Key financial insight 2]
-- [Key financial insight 3]
+prompt_templates = {
+    "system_prompt": """You are a senior financial analyst specializing in discrete asset management.
 
-## Company Profile
-### Overview
-[Company profile summary from get_company_info tool]
-
-### Financial Health
-**Key Metrics:**
-| Metric         | Value      | Trend     |
-|----------------|------------|-----------|
-| Market Cap     | $X         | ↑/↓ X%    |
-| P/E Ratio      | 15.2       | ↑/↓ X%    |
-| Debt/Equity    | 0.45       | ↑/↓ X%    |
-| Earnings Growth| 8%         | ↑/↓ X%    |
-
-### Risk Assessment
-[Analysis of financial health indicators from get_company_financials tool]
-
-## Financial Analysis
-### Core Metrics Comparison
-| Metric         | Company A | Company B | Company C |
-|----------------|----------|----------|----------|
-| Market Cap     | $X       | $Y       | $Z       |
-| P/E Ratio      | 15.2     | 18.7     | 12.4     |
-| Debt/Equity    | 0.45     | 0.62     | 0.31     |
-| Earnings Growth| 8%       | 5%       | 12%      |
-
-### News Impact Analysis
-[Analysis of recent news events from get_company_news tool]
+Tools (use each at most once; pass several symbols as one comma-separated list, e.g. 'MSFT,GOOGL'):
+- get_company_info: company profile and officers
+- get_company_financials: financial statements, price targets, earnings estimates
+- get_company_news: recent news
 
-## Investment Recommendation
-[Detailed recommendation based on analysis, including:
-- Strategic positioning
-- Risk vs. reward assessment
-- Recommended position (buy/hold/sell)
-- Stop-loss/limit orders]
+Use all three, cross-reference metrics with news, compare at least 3 key metrics (market cap, P/E, debt/equity, earnings growth) across companies, and assess risk from financial health indicators. Put figures in markdown tables, bold key metrics and timestamps, and annotate material news with dates.
 
+Response format:
+## Executive Summary
+[Company] in [sector]; 3 key financial insights as bullets
+## Company Profile
+Overview (get_company_info), then a key metrics table:
+| Metric | Company A | Company B | Trend |
+|---|---|---|---|
+| Market Cap | $X | $Y | ↑/↓ X% |
+Risk Assessment (get_company_financials)
+## News Impact Analysis
+[get_company_news, with dates]
+## Investment Recommendation
+Strategic positioning, risk vs. reward, buy/hold/sell, stop-loss/limit levels
 ## Visual Analysis
-[Embedded charts for:
-- Market cap trends
-- Financial ratio comparisons
-- News event timeline]
-
-## Disclaimer
-[Standard disclaimer text from firm's policy]
-#IMPORTANT:
-
-Always verify data freshness from all three tools
-Cross-reference financial metrics with news events
-Provide clear recommendations based on analytical findings
-Use bold for key financial indicators and timestamps """,
+Charts of market cap trends, ratio comparisons, news timeline
+## Disclaimer""",
 "planning": {
     "initial_plan": "",
     "update_plan_pre_messages": "",
@@ -129,18 +121,23 @@ def main():
         index=0,
     )
 
-    # Initialize model and agent
-    model = get_model(model_name)
-    agent = ToolCallingAgent(
-        tools=[get_company_info, get_company_financials, get_company_news],
-        model=model,
-        prompt_templates=prompt_templates,
-        max_tool_threads=1,
-    )
+    # Initialize model and agent. The agent keeps run state, so it is reused
+    # across reruns within a session rather than shared between sessions.
+    if st.session_state.get("agent_model") != model_name:
+        st.session_state.agent = ToolCallingAgent(
+            tools=[get_company_info, get_company_financials, get_company_news],
+            model=get_model(model_name),
+            prompt_templates=prompt_templates,
+            max_tool_threads=1,
+        )
+        st.session_state.agent_model = model_name
+    agent = st.session_state.agent
 
     # Initialize chat history in session state if it doesn't exist
     if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
+        st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_TURNS)
+    if "response_cache" not in st.session_state:
+        st.session_state.response_cache = TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL_SECONDS)
 
     # Add example queries in the sidebar
     st.sidebar.header("Example Questions")
@@ -169,11 +166,16 @@ def main():
 
         try:
             with st.chat_message("assistant"):
-                with st.spinner("Sourcing data and generating report..."):
-                    response = agent.run(query)
-                    st.write(response)
-                    # Add the Q&A pair to chat history
-                    st.session_state.chat_history.append((query, response))
+                # Repeat questions in a session reuse a recent answer
+                cache_key = (model_name, " ".join(query.lower().split()))
+                response = st.session_state.response_cache.get(cache_key)
+                if response is None:
+                    prefetch_tickers(query)
+                    response = run_with_progress(agent, query)
+                    st.session_state.response_cache[cache_key] = response
+                st.write(response)
+                # Add the Q&A pair to chat history
+                st.session_state.chat_history.append((query, response))
         except Exception as e:
             st.error(f"Error: {str(e)}")
 